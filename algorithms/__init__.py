@@ -5,8 +5,27 @@ from .dijkstra import Dijkstra
 from .astar import AStar
 from .greedy_bfs import GreedyBestFirst
 from .bidirectional_bfs import BidirectionalBFS
+from .bidirectional_dijkstra import BidirectionalAStar, BidirectionalDijkstra
 from .uniform_cost_search import UniformCostSearch
 from .jump_point_search import JumpPointSearch
+from .wavefront_bfs import WavefrontBFS
+from .bitset_bfs import BitsetBFS
+from .contraction import ContractedAStar, ContractedDijkstra, JunctionGraph
+from .hpa_star import ClusterGraph, HPAStar
+from .lpa_star import LPAStar
+from .dial_dijkstra import DialDijkstra
+from .grid import Grid
+from .cache import ShortestPathTree, SolveCache
+from .batch import solve_batch
+from .indexed_heap import IndexedHeap
+from .instrumentation import Instrumentation, profile_solver
+from .trace import StepStream, StepTrace
 
 __all__ = ['BaseSolver', 'BFS', 'DFS', 'Dijkstra', 'AStar', 'GreedyBestFirst',
-           'BidirectionalBFS', 'UniformCostSearch', 'JumpPointSearch']
+           'BidirectionalBFS', 'UniformCostSearch', 'JumpPointSearch',
+           'WavefrontBFS', 'BitsetBFS', 'ContractedDijkstra',
+           'ContractedAStar', 'JunctionGraph', 'HPAStar', 'ClusterGraph',
+           'LPAStar', 'DialDijkstra', 'BidirectionalDijkstra',
+           'BidirectionalAStar', 'Grid', 'ShortestPathTree', 'SolveCache',
+           'solve_batch', 'IndexedHeap', 'Instrumentation', 'profile_solver',
+           'StepStream', 'StepTrace']
@@ -1,47 +1,68 @@
-import heapq
-import time
 from .base_solver import BaseSolver
 
 
 class AStar(BaseSolver):
-    def solve_with_steps(self):
-        """A* with step-by-step visualization data"""
-        start_time = time.time()
-        heap = [(self.heuristic(self.start), 0, self.start, [self.start])]
-        visited = set()
-        steps = []
+    name = 'A*'
+
+    def _search(self, steps):
+        """A*, recording each exploration step when steps is given"""
+        grid = self.grid
+        mask, moves, cols, costs = grid.mask, grid.moves, grid.cols, grid.costs
+        scale = grid.min_cost  # Keeps the heuristic admissible on terrain
+        start, end = grid.index(self.start), grid.index(self.end)
+        end_row, end_col = self.end
+        best = grid.new_costs()
+        parent = grid.new_parents()
+        probe = self.instrumentation  # None unless instrumented
+        visited = bytearray(grid.size)
+        best[start] = 0
+        parent[start] = start
+        explored = 0
+        heap, push, pop = self._new_heap([(self.heuristic(self.start), 0, start)])
+        peak_frontier = 1
 
         while heap:
-            _, cost, current, path = heapq.heappop(heap)
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            _, cost, current = pop(heap)
 
-            if current in visited:
+            if visited[current]:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(current))
                 continue
 
-            visited.add(current)
-            steps.append({
-                'current': current,
-                'visited': visited.copy(),
-                'path': path.copy(),
-                'cost': cost,
-                'heuristic': self.heuristic(current)
-            })
-
-            if current == self.end:
-                end_time = time.time()
+            visited[current] = 1
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+            if steps is not None:
+                cell = grid.cell(current)
+                steps.visit(cell, self._parent_cell(parent, current))
+                yield steps.record(cell, cost=cost,
+                                   heuristic=self.heuristic(cell))
+
+            if current == end:
                 return {
-                    'path': path,
-                    'nodes_explored': len(visited),
-                    'path_length': len(path),
-                    'time': end_time - start_time,
-                    'algorithm': 'A*',
-                    'steps': steps
+                    'path': self._walk_parents(parent, current),
+                    'path_cost': cost,
+                    'nodes_explored': explored,
+                    'peak_frontier': peak_frontier
                 }
 
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    new_cost = cost + 1
-                    priority = new_cost + self.heuristic(neighbor)
-                    heapq.heappush(heap, (priority, new_cost,
-                                   neighbor, path + [neighbor]))
+            if probe is not None:
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            new_cost = cost + 1
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                if costs is not None:  # Terrain: pay for entering neighbor
+                    new_cost = cost + costs[neighbor]
+                if new_cost < best[neighbor]:
+                    best[neighbor] = new_cost
+                    parent[neighbor] = current
+                    # Manhattan heuristic, inlined on the flat index
+                    row, col = divmod(neighbor, cols)
+                    priority = new_cost + scale * (abs(row - end_row) + abs(col - end_col))
+                    push(heap, (priority, new_cost, neighbor))
 
         return None
@@ -1,23 +1,171 @@
+import heapq
 import time
+import tracemalloc
+from .grid import Grid
+from .indexed_heap import IndexedHeap
+from .trace import StepStream, StepTrace
 
 
 class BaseSolver:
+    name = None  # Label reported as result['algorithm']
+    instrumentation = None  # Set by instrument()
+    indexed_heap = False  # Set by use_indexed_heap()
+
     def __init__(self, maze, start, end):
-        self.maze = maze
+        # maze may be a prebuilt Grid, shared between solvers
+        self.grid = Grid.of(maze)
+        self.maze = self.grid.maze
         self.start = start
         self.end = end
-        self.rows = len(maze)
-        self.cols = len(maze[0])
+        self.rows = self.grid.rows
+        self.cols = self.grid.cols
+
+    def instrument(self, instrumentation):
+        """Report search events to an Instrumentation (None to stop);
+        summaries then carry its counters as 'counters'"""
+        self.instrumentation = instrumentation
+        return self
+
+    def use_indexed_heap(self, enabled=True):
+        """Queue with an IndexedHeap (decrease-key, one entry per cell)
+        instead of heapq's lazy deletion, for the solvers that build their
+        heap with _new_heap(); returns self"""
+        self.indexed_heap = enabled
+        return self
+
+    def solve(self):
+        """Solve without recording steps; returns the summary dict only.
+
+        Every summary has 'time_ns' (perf_counter_ns) and 'time' (seconds),
+        'peak_frontier' (largest open set), and 'peak_memory': the peak
+        bytes allocated during the search if tracemalloc is tracing, else
+        None.
+        """
+        return self._run(None)
+
+    def solve_with_steps(self):
+        """Solve and keep a StepTrace of the search for visualization"""
+        return self._run(StepTrace())
+
+    def solve_iter(self):
+        """Yield step events lazily while the search runs.
+
+        Each event holds the current cell, the (cell, parent) pairs visited
+        since the previous event of the same direction, and the solver's
+        extra info. Nothing is kept between events, so memory stays flat
+        however long the search runs. The summary dict (or None) is the
+        generator's return value; 'time' excludes the consumer's work and,
+        since the consumer allocates in between, no 'peak_memory' is taken.
+        """
+        search = self._search(StepStream())
+        elapsed = 0
+        while True:
+            start_time = time.perf_counter_ns()
+            try:
+                event = next(search)
+            except StopIteration as done:
+                elapsed += time.perf_counter_ns() - start_time
+                return self._summarize(done.value, elapsed)
+            elapsed += time.perf_counter_ns() - start_time
+            yield event
+
+    def _run(self, steps):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter_ns()
+        result = self._drain(self._search(steps))
+        elapsed = time.perf_counter_ns() - start_time
+        peak_memory = None
+        if tracing:
+            peak_memory = tracemalloc.get_traced_memory()[1] - base_memory
+        return self._summarize(result, elapsed, steps, peak_memory)
+
+    @staticmethod
+    def _drain(search):
+        """Run a search generator to the end and return its return value"""
+        try:
+            while True:
+                next(search)
+        except StopIteration as done:
+            return done.value
+
+    def _summarize(self, result, elapsed_ns, steps=None, peak_memory=None):
+        if result is None:
+            return None
+
+        result['path_length'] = len(result['path'])
+        result['time_ns'] = elapsed_ns
+        result['time'] = elapsed_ns / 1e9
+        result['peak_memory'] = peak_memory
+        if self.instrumentation is not None:
+            result['counters'] = self.instrumentation.export()
+        result['algorithm'] = self.name
+        if steps is not None:
+            result['steps'] = steps
+        return result
+
+    def _search(self, steps):
+        """Generator running the search, recording into steps if given.
+
+        Yields whatever steps.record() returns after each step (nothing at
+        all when steps is None) and returns a dict with 'path' and
+        'nodes_explored', or None when the end cannot be reached.
+        """
+        raise NotImplementedError
+
+    def _new_heap(self, entries):
+        """(frontier, push, pop) for a frontier holding entries: a heapq
+        list, or an IndexedHeap after use_indexed_heap()"""
+        if not self.indexed_heap:
+            return (list(entries),) + self._heap_ops()
+        ops = (IndexedHeap.push, IndexedHeap.pop)
+        if self.instrumentation is not None:
+            ops = self.instrumentation.heap_ops(*ops)
+        return (IndexedHeap(entries),) + ops
+
+    def _heap_ops(self):
+        """(heappush, heappop), counting wrappers when instrumented"""
+        if self.instrumentation is None:
+            return heapq.heappush, heapq.heappop
+        return self.instrumentation.heap_ops()
 
     def get_neighbors(self, pos):
-        row, col = pos
-        neighbors = []
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_row, new_col = row + dr, col + dc
-            if (0 <= new_row < self.rows and 0 <= new_col < self.cols and
-                    self.maze[new_row][new_col] == 0):
-                neighbors.append((new_row, new_col))
-        return neighbors
+        grid = self.grid
+        index = grid.index(pos)
+        return [grid.cell(index + move) for move in grid.moves[grid.mask[index]]]
+
+    def _walk_parents(self, parent, index):
+        """Rebuild the (row, col) path from the root of a parent array.
+
+        The root is the cell that is its own parent.
+        """
+        cols = self.cols
+        path = [divmod(index, cols)]
+        while parent[index] != index:
+            index = parent[index]
+            path.append(divmod(index, cols))
+        path.reverse()
+        return path
+
+    def _reconstruct_path(self, start_parent, end_parent, meeting_point):
+        """Join two parent arrays, rooted at start and at end, into the
+        (row, col) path from start to end through meeting_point"""
+        # Path from start to meeting point
+        path_start = self._walk_parents(start_parent, meeting_point)
+
+        # Path from meeting point to end (excluding meeting point)
+        path_end = self._walk_parents(end_parent, meeting_point)
+        path_end.reverse()
+
+        return path_start + path_end[1:]
+
+    def _parent_cell(self, parent, index):
+        """(row, col) of a cell's parent, or None for the root"""
+        if parent[index] == index:
+            return None
+        return self.grid.cell(parent[index])
 
     def heuristic(self, pos):
         return abs(pos[0] - self.end[0]) + abs(pos[1] - self.end[1])
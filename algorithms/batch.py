@@ -0,0 +1,75 @@
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .cache import ShortestPathTree
+from .grid import Grid
+
+_worker = {}  # Per-process Grid of a parallel batch
+
+
+def solve_batch(maze, queries, workers=1, costs=None):
+    """Answer many (start, end) queries on one maze; yields
+    (start, end, result) as each group of queries is answered.
+
+    The Grid is built once. Queries are grouped by start, and one
+    ShortestPathTree sweep per start (stopping once all of that start's
+    ends are reached) answers the whole group: a BFS with unit step
+    costs, a Dijkstra with terrain (costs, or a Grid carrying them), in
+    which case results also get 'path_cost'. With workers > 1 the groups
+    run in a process pool over a shared-memory copy of the maze, and
+    results stream back in completion order. Each result is a summary
+    dict like solve()'s (None when the end is unreachable);
+    'nodes_explored' and 'time_ns' belong to the shared sweep.
+    """
+    groups = {}
+    for start, end in queries:
+        groups.setdefault(tuple(start), []).append(tuple(end))
+
+    if workers <= 1:
+        grid = Grid.of(maze, costs)
+        for start, ends in groups.items():
+            yield from _answer_group(grid, start, ends)
+        return
+
+    # Only the parallel path needs the maze package's shared memory
+    from maze.shared_maze import SharedMaze
+    cells = maze
+    if isinstance(maze, Grid):
+        cells = maze.maze
+        if costs is None and maze.costs is not None:  # Workers rebuild their Grid with these
+            costs = np.frombuffer(maze.costs, dtype=np.int32).reshape(maze.rows, maze.cols)
+    with SharedMaze.create(cells) as shared:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(shared.name, shared.shape, costs)) as pool:
+            futures = [pool.submit(_run_group, start, ends)
+                       for start, ends in groups.items()]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def _answer_group(grid, start, ends):
+    """One sweep from start, then a parent walk per end"""
+    start_time = time.perf_counter_ns()
+    tree = ShortestPathTree(grid, start, targets=ends)
+    elapsed = time.perf_counter_ns() - start_time
+    for end in ends:
+        path = tree.path_to(end)
+        result = None
+        if path is not None:
+            result = {'path': path, 'path_length': len(path),
+                      'nodes_explored': tree.reached, 'time_ns': elapsed,
+                      'time': elapsed / 1e9, 'algorithm': 'Batch BFS'}
+            if tree.cost is not None:
+                result['path_cost'] = tree.cost[grid.index(end)]
+                result['algorithm'] = 'Batch Dijkstra'
+        yield start, end, result
+
+
+def _init_worker(name, shape, costs=None):
+    from maze.shared_maze import SharedMaze
+    shared = SharedMaze.attach(name, shape)
+    _worker.update(shared=shared, grid=Grid(shared.maze, costs))
+
+
+def _run_group(start, ends):
+    return list(_answer_group(_worker['grid'], start, ends))
@@ -1,39 +1,49 @@
 from collections import deque
-import time
 from .base_solver import BaseSolver
 
 
 class BFS(BaseSolver):
-    def solve_with_steps(self):
-        """BFS with step-by-step visualization data"""
-        start_time = time.time()
-        queue = deque([(self.start, [self.start])])
-        visited = {self.start}
-        steps = []  # Store each exploration step
+    name = 'BFS'
+
+    def _search(self, steps):
+        """BFS, recording each exploration step when steps is given"""
+        grid = self.grid
+        mask, moves = grid.mask, grid.moves
+        start, end = grid.index(self.start), grid.index(self.end)
+        parent = grid.new_parents()  # Doubles as the visited set
+        parent[start] = start
+        probe = self.instrumentation  # None unless instrumented
+        explored = 1
+        queue = deque([start])
+        peak_frontier = 1
+        if steps is not None:
+            steps.visit(self.start)
 
         while queue:
-            current, path = queue.popleft()
-            steps.append({
-                'current': current,
-                'visited': visited.copy(),
-                'path': path.copy(),
-                'queue_size': len(queue)
-            })
+            if len(queue) > peak_frontier:
+                peak_frontier = len(queue)
+            current = queue.popleft()
+            if steps is not None:
+                yield steps.record(grid.cell(current), queue_size=len(queue))
 
-            if current == self.end:
-                end_time = time.time()
+            if current == end:
                 return {
-                    'path': path,
-                    'nodes_explored': len(visited),
-                    'path_length': len(path),
-                    'time': end_time - start_time,
-                    'algorithm': 'BFS',
-                    'steps': steps
+                    'path': self._walk_parents(parent, current),
+                    'nodes_explored': explored,
+                    'peak_frontier': peak_frontier
                 }
 
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                if parent[neighbor] < 0:
+                    parent[neighbor] = current
+                    explored += 1
+                    if steps is not None:
+                        steps.visit(grid.cell(neighbor), grid.cell(current))
+                    queue.append(neighbor)
 
         return None
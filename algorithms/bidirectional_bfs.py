@@ -1,98 +1,77 @@
 from collections import deque
-import time
 from .base_solver import BaseSolver
 
 
 class BidirectionalBFS(BaseSolver):
-    def solve_with_steps(self):
-        """Bidirectional BFS with step-by-step visualization data"""
-        start_time = time.time()
-        start_queue = deque([(self.start, [self.start])])
-        end_queue = deque([(self.end, [self.end])])
-        start_visited = {self.start}
-        end_visited = {self.end}
-        start_parent = {self.start: None}
-        end_parent = {self.end: None}
-        steps = []
+    """BFS from both ends, a whole layer at a time.
 
-        while start_queue and end_queue:
-            # Forward search
-            current_start, path_start = start_queue.popleft()
-            steps.append({
-                'current': current_start,
-                'visited': start_visited.copy(),
-                'path': path_start.copy(),
-                'direction': 'forward'
-            })
+    Each round expands every cell of the smaller frontier, so a lopsided
+    maze cannot leave one side doing most of the work. Because whole
+    layers alternate, the first cell found by both searches already lies
+    on a shortest path: any shorter one would have met a layer earlier.
+    """
+    name = 'Bidirectional BFS'
 
-            for neighbor in self.get_neighbors(current_start):
-                if neighbor not in start_visited:
-                    start_visited.add(neighbor)
-                    start_queue.append((neighbor, path_start + [neighbor]))
-                    start_parent[neighbor] = current_start
+    def _search(self, steps):
+        """Bidirectional BFS, recording each step when steps is given"""
+        grid = self.grid
+        mask, moves = grid.mask, grid.moves
+        start, end = grid.index(self.start), grid.index(self.end)
+        # The parent arrays double as the visited sets of each side
+        start_parent = grid.new_parents()
+        end_parent = grid.new_parents()
+        start_parent[start] = start
+        end_parent[end] = end
+        probe = self.instrumentation  # None unless instrumented
+        start_queue = deque([start])
+        end_queue = deque([end])
+        explored = 2
+        peak_frontier = 2
+        if steps is not None:
+            steps.visit(self.start)
+            steps.visit(self.end, direction='backward')
+        if start == end:
+            return {'path': [self.start], 'nodes_explored': 1, 'peak_frontier': 1}
 
-                    if neighbor in end_visited:
-                        # Found intersection
-                        end_time = time.time()
-                        # Reconstruct path
-                        path = self._reconstruct_path(
-                            start_parent, end_parent, neighbor)
-                        return {
-                            'path': path,
-                            'nodes_explored': len(start_visited) + len(end_visited),
-                            'path_length': len(path),
-                            'time': end_time - start_time,
-                            'algorithm': 'Bidirectional BFS',
-                            'steps': steps
-                        }
+        while start_queue and end_queue:
+            frontier = len(start_queue) + len(end_queue)
+            if frontier > peak_frontier:
+                peak_frontier = frontier
+            if len(start_queue) <= len(end_queue):
+                queue, parent, other = start_queue, start_parent, end_parent
+                direction = 'forward'
+            else:
+                queue, parent, other = end_queue, end_parent, start_parent
+                direction = 'backward'
+            if probe is not None:
+                probe.emit('layer_cells', None, len(queue))
 
-            # Backward search
-            current_end, path_end = end_queue.popleft()
-            steps.append({
-                'current': current_end,
-                'visited': end_visited.copy(),
-                'path': path_end.copy(),
-                'direction': 'backward'
-            })
+            for _ in range(len(queue)):
+                current = queue.popleft()
+                if steps is not None:
+                    yield steps.record(grid.cell(current), direction=direction)
 
-            for neighbor in self.get_neighbors(current_end):
-                if neighbor not in end_visited:
-                    end_visited.add(neighbor)
-                    end_queue.append((neighbor, path_end + [neighbor]))
-                    end_parent[neighbor] = current_end
+                if probe is not None:
+                    probe.emit('expand', grid.cell(current))
+                    probe.emit('neighbor_check', grid.cell(current),
+                               len(moves[mask[current]]))
+                for move in moves[mask[current]]:
+                    neighbor = current + move
+                    if parent[neighbor] < 0:
+                        parent[neighbor] = current
+                        queue.append(neighbor)
+                        explored += 1
+                        if steps is not None:
+                            steps.visit(grid.cell(neighbor), grid.cell(current),
+                                        direction=direction)
 
-                    if neighbor in start_visited:
-                        # Found intersection
-                        end_time = time.time()
-                        # Reconstruct path
-                        path = self._reconstruct_path(
-                            start_parent, end_parent, neighbor)
-                        return {
-                            'path': path,
-                            'nodes_explored': len(start_visited) + len(end_visited),
-                            'path_length': len(path),
-                            'time': end_time - start_time,
-                            'algorithm': 'Bidirectional BFS',
-                            'steps': steps
-                        }
+                        if other[neighbor] >= 0:
+                            # Found intersection
+                            return {
+                                'path': self._reconstruct_path(
+                                    start_parent, end_parent, neighbor),
+                                'nodes_explored': explored,
+                                'peak_frontier': peak_frontier
+                            }
 
         return None
-
-    def _reconstruct_path(self, start_parent, end_parent, meeting_point):
-        """Reconstruct the path from start to end through meeting point"""
-        # Path from start to meeting point
-        path_start = []
-        current = meeting_point
-        while current is not None:
-            path_start.append(current)
-            current = start_parent.get(current)
-        path_start.reverse()
-
-        # Path from meeting point to end (excluding meeting point)
-        path_end = []
-        current = end_parent.get(meeting_point)
-        while current is not None:
-            path_end.append(current)
-            current = end_parent.get(current)
-
-        return path_start + path_end
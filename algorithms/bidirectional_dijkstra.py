@@ -0,0 +1,125 @@
+from .base_solver import BaseSolver
+
+
+class BidirectionalDijkstra(BaseSolver):
+    """Dijkstra from both ends at once, meeting in the middle.
+
+    Each round settles one cell of the side with the smaller heap. The
+    backward side walks moves in reverse, so stepping back out of a cell
+    pays that cell's cost. The cheapest start-to-end route seen through a
+    cell labelled by both sides is kept as the best so far. Meeting is not
+    enough to stop on weighted grids: the search ends only once the two
+    heap tops together cost at least the best, as no unseen route can then
+    be cheaper.
+    """
+    name = 'Bidirectional Dijkstra'
+    guided = False  # Steer both sides with A* potentials
+
+    def _search(self, steps):
+        """Bidirectional search, recording each step when steps is given"""
+        grid = self.grid
+        mask, moves, cols, costs = grid.mask, grid.moves, grid.cols, grid.costs
+        start, end = grid.index(self.start), grid.index(self.end)
+        if start == end:
+            return {'path': [self.start], 'path_cost': 0,
+                    'nodes_explored': 1, 'peak_frontier': 1}
+        start_row, start_col = self.start
+        end_row, end_col = self.end
+        scale = grid.min_cost if self.guided else 0
+
+        def potential(index):
+            # Twice the forward potential: the estimate to the end minus
+            # the one to the start. Halved, this average keeps both sides'
+            # keys consistent; doubled, it stays an integer
+            row, col = divmod(index, cols)
+            return scale * (abs(row - end_row) + abs(col - end_col)
+                            - abs(row - start_row) - abs(col - start_col))
+
+        start_cost, end_cost = grid.new_costs(), grid.new_costs()
+        start_parent, end_parent = grid.new_parents(), grid.new_parents()
+        start_cost[start] = end_cost[end] = 0
+        start_parent[start] = start
+        end_parent[end] = end
+        closed = bytearray(grid.size)  # 1 forward, 2 backward
+        probe = self.instrumentation  # None unless instrumented
+        # Keys are doubled costs plus the side's doubled potential
+        start_heap, push, pop = self._new_heap([(potential(start), start)])
+        end_heap, _, _ = self._new_heap([(-potential(end), end)])
+        # Cost through the best meeting point; unreached costs are as
+        # large, so a cell labelled by one side only never improves it
+        best, meeting_point = 2 ** 31 - 1, -1
+        explored = 0
+        peak_frontier = 2
+
+        while start_heap and end_heap:
+            frontier = len(start_heap) + len(end_heap)
+            if frontier > peak_frontier:
+                peak_frontier = frontier
+            if start_heap[0][0] + end_heap[0][0] >= 2 * best:
+                break
+
+            if len(start_heap) <= len(end_heap):
+                heap, cost, other_cost, parent = start_heap, start_cost, end_cost, start_parent
+                side, sign, direction = 1, 1, 'forward'
+            else:
+                heap, cost, other_cost, parent = end_heap, end_cost, start_cost, end_parent
+                side, sign, direction = 2, -1, 'backward'
+            _, current = pop(heap)
+            if closed[current] & side:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(current))
+                continue
+
+            closed[current] |= side
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            if steps is not None:
+                steps.visit(grid.cell(current), self._parent_cell(parent, current),
+                            direction=direction)
+                yield steps.record(grid.cell(current), cost=cost[current],
+                                   direction=direction)
+
+            # Forward steps pay for the cell entered, backward ones for
+            # the cell left (current), the same for every neighbor
+            entering = costs if side == 1 else None
+            new_cost = cost[current] + 1
+            if costs is not None and side == 2:
+                new_cost = cost[current] + costs[current]
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                if entering is not None:
+                    new_cost = cost[current] + entering[neighbor]
+                if new_cost < cost[neighbor]:
+                    cost[neighbor] = new_cost
+                    parent[neighbor] = current
+                    if scale:
+                        push(heap, (2 * new_cost + sign * potential(neighbor), neighbor))
+                    else:
+                        push(heap, (2 * new_cost, neighbor))
+                    if new_cost + other_cost[neighbor] < best:
+                        best = new_cost + other_cost[neighbor]
+                        meeting_point = neighbor
+
+        if meeting_point < 0:
+            return None
+        return {
+            'path': self._reconstruct_path(start_parent, end_parent, meeting_point),
+            'path_cost': best,
+            'nodes_explored': explored,
+            'peak_frontier': peak_frontier
+        }
+
+
+class BidirectionalAStar(BidirectionalDijkstra):
+    """Bidirectional Dijkstra steered by A* potentials.
+
+    Each side orders its heap by cost plus half the difference between the
+    estimates to its goal and back to its own root (average potentials),
+    so both sides see the same consistent reduced step costs. The same
+    stopping rule as Bidirectional Dijkstra then stays exact.
+    """
+    name = 'Bidirectional A*'
+    guided = True
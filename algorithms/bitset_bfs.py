@@ -0,0 +1,125 @@
+import numpy as np
+from .base_solver import BaseSolver
+
+# Set bits in every byte value, for counting cells in a bitset
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)],
+                     dtype=np.uint8)
+
+
+class BitsetBFS(BaseSolver):
+    """Bit-parallel BFS over row bitsets.
+
+    Each maze row is packed into uint64 words (bit c of the row = cell
+    (row, c)), so one BFS layer is a handful of array shifts, ORs and
+    ANDs with the open mask, 64 cells per machine word. Only the words
+    holding frontier bits and their neighbors are gathered, by index, so
+    a thin wave spread over the whole maze costs a few words per cell,
+    not a pass over every row. Instead of a parent per cell,
+    each cell's distance mod 3 is kept in three more bitsets; that is
+    enough to walk back from the end, because a visited neighbor's
+    distance differs by at most one.
+    """
+    name = 'Bitset BFS'
+
+    def _search(self, steps):
+        """Bit-parallel BFS, recording one step per layer when steps is given"""
+        if not self.grid.open[self.grid.index(self.start)]:
+            return None
+        open_words = self._pack_rows()
+        unvisited = open_words.copy()
+        frontier = np.zeros_like(open_words)
+        residues = [np.zeros_like(open_words) for _ in range(3)]  # distance mod 3
+
+        start_row, start_col = self.start
+        end_row, end_col = self.end
+        for bits in (frontier, residues[0]):
+            self._set_bit(bits, self.start)
+        unvisited &= ~frontier
+        end_word, end_bit = end_col >> 6, np.uint64(1 << (end_col & 63))
+        one, carry = np.uint64(1), np.uint64(63)
+        if steps is not None:
+            steps.visit(self.start)
+            yield steps.record(self.start, distance=0, frontier_size=1)
+
+        # Flat views: word w's neighbors are w +- 1 and w +- stride. The
+        # zero pad word ending each row and the two zero rows at the
+        # bottom catch every neighbor off the grid, negative ids included
+        stride = frontier.shape[1]
+        flat_frontier, flat_unvisited = frontier.reshape(-1), unvisited.reshape(-1)
+        flat_residues = [bits.reshape(-1) for bits in residues]
+        active = np.array([start_row * stride + (start_col >> 6)])  # Frontier words
+        distance = 0
+        peak_frontier = 1
+        while not frontier[end_row, end_word] & end_bit:
+            near = np.unique(np.concatenate((active - stride, active - 1, active,
+                                             active + 1, active + stride)))
+            window = flat_frontier[near]
+            grow = (window << one) | (window >> one)     # col +- 1
+            grow |= flat_frontier[near - 1] >> carry       # col + 1 across words
+            grow |= flat_frontier[near + 1] << carry       # col - 1 across words
+            grow |= flat_frontier[near - stride]           # row + 1
+            grow |= flat_frontier[near + stride]           # row - 1
+            wave = grow & flat_unvisited[near]
+
+            hit = wave != 0
+            if not hit.any():
+                return None
+
+            distance += 1
+            flat_frontier[active] = 0
+            active, wave = near[hit], wave[hit]
+            flat_frontier[active] = wave
+            flat_unvisited[active] &= ~wave
+            flat_residues[distance % 3][active] |= wave
+            layer_size = int(_POPCOUNT[wave.view(np.uint8)].sum(dtype=np.int64))
+            peak_frontier = max(peak_frontier, layer_size)
+            if self.instrumentation is not None:
+                self.instrumentation.emit('layer_cells', count=layer_size)
+
+            if steps is not None:
+                bits = np.unpackbits(wave.view(np.uint8).reshape(-1, 8), axis=1,
+                                     bitorder='little')
+                cells = []
+                for slot, bit in np.argwhere(bits):
+                    row, word = divmod(int(active[slot]), stride)
+                    cells.append((row, word * 64 + int(bit)))
+                for cell in cells:
+                    steps.visit(cell, self._back_step(residues, distance, cell))
+                # Show the wave cell closest to the end as the current one
+                yield steps.record(min(cells, key=self.heuristic),
+                                   distance=distance, frontier_size=len(cells))
+
+        path = [self.end]
+        for d in range(distance, 0, -1):
+            path.append(self._back_step(residues, d, path[-1]))
+        path.reverse()
+        visited = (open_words ^ unvisited).view(np.uint8)
+        return {
+            'path': path,
+            'nodes_explored': int(_POPCOUNT[visited].sum(dtype=np.int64)),
+            'peak_frontier': peak_frontier
+        }
+
+    def _pack_rows(self):
+        """(rows + 2, words + 1) uint64 array with a bit set for every open
+        cell; the last word of each row and the last two rows stay zero"""
+        grid = self.grid
+        words = (grid.cols + 63) // 64 + 1
+        is_open = np.zeros((grid.rows + 2, words * 64), dtype=np.uint8)
+        is_open[:grid.rows, :grid.cols] = np.frombuffer(
+            grid.open, dtype=np.uint8).reshape(grid.rows, grid.cols)
+        packed = np.packbits(is_open, axis=1, bitorder='little')
+        return packed.view('<u8').copy()
+
+    @staticmethod
+    def _set_bit(bits, cell):
+        row, col = cell
+        bits[row, col >> 6] |= np.uint64(1 << (col & 63))
+
+    def _back_step(self, residues, distance, cell):
+        """A neighbor of cell (at the given distance) one step closer to start"""
+        previous = residues[(distance - 1) % 3]
+        for row, col in self.get_neighbors(cell):
+            if int(previous[row, col >> 6]) >> (col & 63) & 1:
+                return (row, col)
+        return None
@@ -0,0 +1,225 @@
+import heapq
+import time
+from collections import OrderedDict, deque
+from .grid import Grid
+
+
+class ShortestPathTree:
+    """Shortest-path tree of every cell reachable from one start cell.
+
+    With unit step costs this is a BFS tree, which is also a Dijkstra
+    tree; on a Grid with terrain costs it is built by a Dijkstra sweep.
+    Either way a path to any end is a walk up the parent pointers, with
+    no search. Given targets, the sweep stops as soon as all of them are
+    reached; only paths to those are then guaranteed.
+    """
+    cost = None  # Flat array of path costs, terrain only
+    peak_frontier = 1  # Largest queue or heap of the sweep
+
+    def __init__(self, grid, start, targets=None):
+        self.grid = grid
+        self.start = start
+        root = grid.index(start)
+        parent = grid.new_parents()
+        parent[root] = root
+        # Open target cells still to reach; walls can never be reached
+        remaining = None
+        if targets is not None:
+            remaining = {grid.index(cell) for cell in targets} - {root}
+            remaining = {index for index in remaining if grid.open[index]}
+        if grid.costs is None:
+            self.reached = self._sweep(root, parent, remaining)
+        else:
+            self.reached = self._weighted_sweep(root, parent, remaining)
+        self.parent = parent
+
+    def _sweep(self, root, parent, remaining):
+        """BFS from root filling parent; returns the cells reached"""
+        mask, moves = self.grid.mask, self.grid.moves
+        reached = peak_frontier = 1
+        queue = deque([root])
+        while queue and remaining != set():
+            if len(queue) > peak_frontier:
+                peak_frontier = len(queue)
+            current = queue.popleft()
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                if parent[neighbor] < 0:
+                    parent[neighbor] = current
+                    reached += 1
+                    queue.append(neighbor)
+                    if remaining:
+                        remaining.discard(neighbor)
+        self.peak_frontier = peak_frontier
+        return reached
+
+    def _weighted_sweep(self, root, parent, remaining):
+        """Dijkstra from root filling parent and self.cost; returns the
+        cells settled"""
+        grid = self.grid
+        mask, moves, costs = grid.mask, grid.moves, grid.costs
+        cost = self.cost = grid.new_costs()
+        cost[root] = 0
+        settled = bytearray(grid.size)
+        reached = 0
+        peak_frontier = 1
+        heap = [(0, root)]
+        # A target only counts once settled, as its cost may still drop
+        while heap and remaining != set():
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            current_cost, current = heapq.heappop(heap)
+            if settled[current]:
+                continue
+            settled[current] = 1
+            reached += 1
+            if remaining:
+                remaining.discard(current)
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                new_cost = current_cost + costs[neighbor]
+                if new_cost < cost[neighbor]:
+                    cost[neighbor] = new_cost
+                    parent[neighbor] = current
+                    heapq.heappush(heap, (new_cost, neighbor))
+        self.peak_frontier = peak_frontier
+        return reached
+
+    def path_to(self, end):
+        """List of (row, col) from start to end, or None if unreachable"""
+        grid, parent = self.grid, self.parent
+        index = grid.index(end)
+        if parent[index] < 0:
+            return None
+        path = [end]
+        while parent[index] != index:
+            index = parent[index]
+            path.append(grid.cell(index))
+        path.reverse()
+        return path
+
+
+class SolveCache:
+    """LRU cache in front of the solvers.
+
+    Results are keyed by the maze's content digest plus (algorithm,
+    start, end), so equal mazes share entries however they are passed
+    in. For the solvers in TREE_SOLVERS, a second query from a start that
+    was already seen builds that start's ShortestPathTree; later queries
+    from it, to any end, are answered by walking the tree. Both tables
+    evict least recently used entries: results beyond max_results, trees
+    beyond max_tree_cells cells in total.
+    """
+    TREE_SOLVERS = ('BFS', 'Dijkstra')
+
+    def __init__(self, max_results=256, max_tree_cells=16_000_000):
+        self.max_results = max_results
+        self.max_tree_cells = max_tree_cells
+        self.results = OrderedDict()
+        self.trees = OrderedDict()
+        self.sources = OrderedDict()  # (digest, algorithm, start) seen once
+        self.tree_cells = 0
+        self.hits = self.tree_hits = self.misses = 0
+
+    def solve(self, solver_cls, maze, start, end):
+        """Cached solver_cls(maze, start, end).solve(); the summary gets
+        'cached': True when no search was run"""
+        grid = Grid.of(maze)
+        digest = grid.digest()
+        key = (digest, solver_cls.name, start, end)
+        result = self.results.get(key)
+        if result is not None:
+            self.results.move_to_end(key)
+            self.hits += 1
+            return self._copy(result)
+
+        # BFS counts steps on terrain while trees follow its costs, so
+        # terrain always runs the solver
+        if solver_cls.name in self.TREE_SOLVERS and grid.costs is None:
+            source = (digest, solver_cls.name, start)
+            if source in self.sources or (digest, start) in self.trees:
+                built = (digest, start) not in self.trees
+                result = self._from_tree(grid, solver_cls.name, start, end)
+                self._store(key, result)
+                return self._copy(result, cached=not built)
+            self._remember_source(source)
+
+        self.misses += 1
+        result = solver_cls(grid, start, end).solve()
+        if result is not None:
+            result.pop('steps', None)
+            self._store(key, result)
+            result = self._copy(result, cached=False)
+        return result
+
+    def tree(self, maze, start):
+        """The ShortestPathTree from start, built on first use"""
+        grid = Grid.of(maze)
+        key = (grid.digest(), start)
+        tree = self.trees.get(key)
+        if tree is not None:
+            self.trees.move_to_end(key)
+            return tree
+
+        tree = ShortestPathTree(grid, start)
+        self.trees[key] = tree
+        self.tree_cells += grid.size
+        while self.tree_cells > self.max_tree_cells and len(self.trees) > 1:
+            _, old = self.trees.popitem(last=False)
+            self.tree_cells -= old.grid.size
+        return tree
+
+    def clear(self):
+        self.results.clear()
+        self.trees.clear()
+        self.sources.clear()
+        self.tree_cells = 0
+
+    def stats(self):
+        return {'hits': self.hits, 'tree_hits': self.tree_hits,
+                'misses': self.misses, 'results': len(self.results),
+                'trees': len(self.trees)}
+
+    def _from_tree(self, grid, algorithm, start, end):
+        """A summary like solve()'s, from the tree; the query that builds
+        the tree is charged for its sweep, later ones for the walk alone"""
+        built = (grid.digest(), start) not in self.trees
+        if built:
+            self.misses += 1
+        else:
+            self.tree_hits += 1
+        start_time = time.perf_counter_ns()
+        tree = self.tree(grid, start)
+        path = tree.path_to(end)
+        elapsed = time.perf_counter_ns() - start_time
+        if path is None:
+            return None
+        result = {'path': path,
+                  'nodes_explored': tree.reached if built else 0,
+                  'peak_frontier': tree.peak_frontier if built else 0,
+                  'path_length': len(path), 'time_ns': elapsed,
+                  'time': elapsed / 1e9, 'peak_memory': None,
+                  'algorithm': algorithm}
+        if algorithm == 'Dijkstra':
+            result['path_cost'] = len(path) - 1  # Unit steps
+        return result
+
+    def _store(self, key, result):
+        if result is None:
+            return
+        self.results[key] = result
+        self.results.move_to_end(key)
+        while len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+    def _remember_source(self, source):
+        self.sources[source] = True
+        while len(self.sources) > self.max_results:
+            self.sources.popitem(last=False)
+
+    @staticmethod
+    def _copy(result, cached=True):
+        """Copy handed to callers, so they cannot change the cached entry"""
+        if result is None:
+            return None
+        return dict(result, path=list(result['path']), cached=cached)
@@ -0,0 +1,200 @@
+import numpy as np
+from .base_solver import BaseSolver
+from .grid import GraphCache
+
+# Number of open neighbors for each 4-bit neighbor mask
+DEGREE = tuple(bin(bits).count('1') for bits in range(16))
+
+
+class JunctionGraph:
+    """A maze contracted to its junctions and dead ends.
+
+    Every open cell whose degree is not 2 is a node; each corridor of
+    degree-2 cells between two nodes becomes one edge, weighted by its
+    length and stored as (other node, length, first move) so the cells
+    can be walked again when a path is expanded. Build it once per maze
+    with JunctionGraph.of(grid); graphs are kept for the last few mazes
+    by content digest.
+    """
+    _cache = GraphCache(8)
+
+    def __init__(self, grid):
+        self.grid = grid
+        mask = grid.mask
+        is_open = np.frombuffer(grid.open, dtype=np.uint8).astype(bool)
+        degree = np.array(DEGREE, dtype=np.uint8)[np.frombuffer(mask, dtype=np.uint8)]
+        nodes = np.flatnonzero(is_open & (degree != 2))
+        self.is_node = bytearray(grid.size)
+        np.frombuffer(self.is_node, dtype=np.uint8)[nodes] = 1
+        self.edges = {}
+        for node in nodes.tolist():
+            links = []
+            for move in grid.moves[mask[node]]:
+                other, length, _ = self.walk(node, move)
+                if other != node:  # A corridor looping back gains nothing
+                    links.append((other, length, move))
+            self.edges[node] = links
+
+    @classmethod
+    def of(cls, grid):
+        """The (cached) junction graph of a Grid"""
+        return cls._cache.get(lambda: cls(grid), grid)
+
+    def walk(self, cell, move, stop=-1):
+        """Follow the corridor leaving cell by move until a node, stop or
+        back at cell; returns (cell reached, length, last move)"""
+        mask, moves, is_node = self.grid.mask, self.grid.moves, self.is_node
+        prev, current, length = cell, cell + move, 1
+        while not is_node[current] and current != stop and current != cell:
+            for move in moves[mask[current]]:
+                if current + move != prev:
+                    break
+            prev, current = current, current + move
+            length += 1
+        return current, length, move
+
+    def corridor(self, cell, move, stop):
+        """Cells after cell, leaving by move, up to and including stop"""
+        mask, moves = self.grid.mask, self.grid.moves
+        prev, current = cell, cell + move
+        cells = [current]
+        while current != stop:
+            for move in moves[mask[current]]:
+                if current + move != prev:
+                    break
+            prev, current = current, current + move
+            cells.append(current)
+        return cells
+
+    def links(self, cell, stop=-1):
+        """(node or stop reached, length, first move) along each corridor
+        out of a cell that is not itself a node"""
+        return [self.walk(cell, move, stop)[:2] + (move,)
+                for move in self.grid.moves[self.grid.mask[cell]]]
+
+
+class ContractedDijkstra(BaseSolver):
+    """Dijkstra over the JunctionGraph instead of the cell grid.
+
+    Start and end may sit inside corridors: they are linked to the nodes
+    at both ends of theirs for the query. Only nodes are expanded, and
+    the answer is expanded back into the full cell path.
+    """
+    name = 'Contracted Dijkstra'
+    use_heuristic = False
+
+    def _search(self, steps):
+        """Search the junction graph, recording each expanded node"""
+        grid = self.grid
+        graph = JunctionGraph.of(grid)
+        start, end = grid.index(self.start), grid.index(self.end)
+        end_row, end_col = self.end
+        cols = grid.cols
+        if not grid.open[start] or not grid.open[end]:
+            return None
+        if start == end:
+            return {'path': [self.start], 'nodes_explored': 1, 'peak_frontier': 1}
+
+        # How to finish: node -> (length, move) of its corridor to the end
+        if graph.is_node[end]:
+            to_end = {end: (0, None)}
+        else:
+            to_end = {}
+            for node, length, move in graph.links(end, stop=start):
+                if node == end:  # A ring with no junction leads nowhere
+                    continue
+                back = graph.walk(end, move, stop=start)[2]
+                if node not in to_end or length < to_end[node][0]:
+                    to_end[node] = (length, -back)
+
+        best_end, end_link = float('inf'), None
+        best, parent = {}, {}
+        heap = []
+        push, pop = self._heap_ops()
+        probe = self.instrumentation  # None unless instrumented
+        if graph.is_node[start]:
+            best[start], parent[start] = 0, None
+            heap.append((self._estimate(start, cols, end_row, end_col), 0, start))
+        else:
+            for node, length, move in graph.links(start, stop=end):
+                if node == start:  # A ring with no junction leads nowhere
+                    continue
+                if node == end:  # Start and end share a corridor
+                    if length < best_end:
+                        best_end, end_link = length, (start, move)
+                elif length < best.get(node, best_end):
+                    best[node], parent[node] = length, (start, move)
+                    priority = length + self._estimate(node, cols, end_row, end_col)
+                    push(heap, (priority, length, node))
+
+        closed = set()
+        explored = 0
+        peak_frontier = len(heap)
+        while heap:
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            priority, cost, node = pop(heap)
+            if priority >= best_end:
+                break
+            if node in closed:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(node))
+                continue
+
+            closed.add(node)
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(node))
+                probe.emit('neighbor_check', grid.cell(node), len(graph.edges[node]))
+            if steps is not None:
+                link = parent[node]
+                steps.visit(grid.cell(node), None if link is None else grid.cell(link[0]))
+                yield steps.record(grid.cell(node), cost=cost)
+
+            if node in to_end:
+                length, move = to_end[node]
+                if cost + length < best_end:
+                    best_end, end_link = cost + length, (node, move)
+
+            for other, length, move in graph.edges[node]:
+                new_cost = cost + length
+                if new_cost < best.get(other, best_end):
+                    best[other], parent[other] = new_cost, (node, move)
+                    priority = new_cost + self._estimate(other, cols, end_row, end_col)
+                    push(heap, (priority, new_cost, other))
+
+        if end_link is None:
+            return None
+        return {
+            'path': self._expand(graph, parent, end_link, end, start),
+            'nodes_explored': explored,
+            'peak_frontier': peak_frontier
+        }
+
+    def _estimate(self, node, cols, end_row, end_col):
+        if not self.use_heuristic:
+            return 0
+        row, col = divmod(node, cols)
+        return abs(row - end_row) + abs(col - end_col)
+
+    def _expand(self, graph, parent, end_link, end, start):
+        """Cell path from start to end, walking each corridor used"""
+        segments = []
+        node, move = end_link
+        if move is not None:
+            segments.append(graph.corridor(node, move, end))
+        while node != start and parent[node] is not None:
+            prev, move = parent[node]
+            segments.append(graph.corridor(prev, move, node))
+            node = prev
+
+        path = [start]
+        for cells in reversed(segments):
+            path.extend(cells)
+        return [self.grid.cell(index) for index in path]
+
+
+class ContractedAStar(ContractedDijkstra):
+    """A* over the JunctionGraph (Manhattan distance to the end)"""
+    name = 'Contracted A*'
+    use_heuristic = True
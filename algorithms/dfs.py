@@ -1,38 +1,48 @@
-import time
 from .base_solver import BaseSolver
 
 
 class DFS(BaseSolver):
-    def solve_with_steps(self):
-        """DFS with step-by-step visualization data"""
-        start_time = time.time()
-        stack = [(self.start, [self.start])]
-        visited = {self.start}
-        steps = []
+    name = 'DFS'
+
+    def _search(self, steps):
+        """DFS, recording each exploration step when steps is given"""
+        grid = self.grid
+        mask, moves = grid.mask, grid.moves
+        start, end = grid.index(self.start), grid.index(self.end)
+        parent = grid.new_parents()  # Doubles as the visited set
+        parent[start] = start
+        probe = self.instrumentation  # None unless instrumented
+        explored = 1
+        stack = [start]
+        peak_frontier = 1
+        if steps is not None:
+            steps.visit(self.start)
 
         while stack:
-            current, path = stack.pop()
-            steps.append({
-                'current': current,
-                'visited': visited.copy(),
-                'path': path.copy(),
-                'stack_size': len(stack)
-            })
+            if len(stack) > peak_frontier:
+                peak_frontier = len(stack)
+            current = stack.pop()
+            if steps is not None:
+                yield steps.record(grid.cell(current), stack_size=len(stack))
 
-            if current == self.end:
-                end_time = time.time()
+            if current == end:
                 return {
-                    'path': path,
-                    'nodes_explored': len(visited),
-                    'path_length': len(path),
-                    'time': end_time - start_time,
-                    'algorithm': 'DFS',
-                    'steps': steps
+                    'path': self._walk_parents(parent, current),
+                    'nodes_explored': explored,
+                    'peak_frontier': peak_frontier
                 }
 
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append((neighbor, path + [neighbor]))
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                if parent[neighbor] < 0:
+                    parent[neighbor] = current
+                    explored += 1
+                    if steps is not None:
+                        steps.visit(grid.cell(neighbor), grid.cell(current))
+                    stack.append(neighbor)
 
         return None
@@ -0,0 +1,78 @@
+from .base_solver import BaseSolver
+
+
+class DialDijkstra(BaseSolver):
+    """Dijkstra with Dial's bucket queue instead of a binary heap.
+
+    Step costs are small positive integers, so every queued cost lies
+    within max_cost of the one being expanded. A ring of max_cost + 1
+    buckets, one per cost, then replaces the heap: pushing is an append,
+    and the next cell comes from the first non-empty bucket, with no
+    O(log n) sift either way.
+    """
+    name = 'Dial Dijkstra'
+
+    def _search(self, steps):
+        """Dial's algorithm, recording each step when steps is given"""
+        grid = self.grid
+        mask, moves, costs = grid.mask, grid.moves, grid.costs
+        start, end = grid.index(self.start), grid.index(self.end)
+        best = grid.new_costs()
+        parent = grid.new_parents()
+        probe = self.instrumentation  # None unless instrumented
+        visited = bytearray(grid.size)
+        best[start] = 0
+        parent[start] = start
+        explored = 0
+        width = grid.max_cost + 1
+        buckets = [[] for _ in range(width)]
+        buckets[0].append(start)
+        queued = peak_frontier = 1
+        cost = 0
+
+        while queued:
+            # Every step costs at least 1, so cells queued while draining
+            # this bucket land in later ones and it empties for good
+            bucket = buckets[cost % width]
+            while bucket:
+                current = bucket.pop()
+                queued -= 1
+                if visited[current] or best[current] != cost:
+                    if probe is not None:
+                        probe.emit('stale_skip', grid.cell(current))
+                    continue
+
+                visited[current] = 1
+                explored += 1
+                if probe is not None:
+                    probe.emit('expand', grid.cell(current))
+                if steps is not None:
+                    steps.visit(grid.cell(current), self._parent_cell(parent, current))
+                    yield steps.record(grid.cell(current), cost=cost)
+
+                if current == end:
+                    return {
+                        'path': self._walk_parents(parent, current),
+                        'path_cost': cost,
+                        'nodes_explored': explored,
+                        'peak_frontier': peak_frontier
+                    }
+
+                if probe is not None:
+                    probe.emit('neighbor_check', grid.cell(current),
+                               len(moves[mask[current]]))
+                new_cost = cost + 1
+                for move in moves[mask[current]]:
+                    neighbor = current + move
+                    if costs is not None:  # Terrain: pay for entering neighbor
+                        new_cost = cost + costs[neighbor]
+                    if new_cost < best[neighbor]:
+                        best[neighbor] = new_cost
+                        parent[neighbor] = current
+                        buckets[new_cost % width].append(neighbor)
+                        queued += 1
+                if queued > peak_frontier:
+                    peak_frontier = queued
+            cost += 1
+
+        return None
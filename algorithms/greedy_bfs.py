@@ -1,44 +1,60 @@
-import heapq
-import time
 from .base_solver import BaseSolver
 
 
 class GreedyBestFirst(BaseSolver):
-    def solve_with_steps(self):
-        """Greedy Best-First Search with step-by-step visualization data"""
-        start_time = time.time()
-        heap = [(self.heuristic(self.start), self.start, [self.start])]
-        visited = set()
-        steps = []
+    name = 'Greedy Best-First'
+
+    def _search(self, steps):
+        """Greedy Best-First Search, recording each step when steps is given"""
+        grid = self.grid
+        mask, moves, cols = grid.mask, grid.moves, grid.cols
+        start, end = grid.index(self.start), grid.index(self.end)
+        end_row, end_col = self.end
+        parent = grid.new_parents()
+        probe = self.instrumentation  # None unless instrumented
+        visited = bytearray(grid.size)
+        parent[start] = start
+        explored = 0
+        heap, push, pop = self._new_heap([(self.heuristic(self.start), start)])
+        peak_frontier = 1
 
         while heap:
-            _, current, path = heapq.heappop(heap)
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            _, current = pop(heap)
 
-            if current in visited:
+            if visited[current]:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(current))
                 continue
 
-            visited.add(current)
-            steps.append({
-                'current': current,
-                'visited': visited.copy(),
-                'path': path.copy(),
-                'heuristic': self.heuristic(current)
-            })
+            visited[current] = 1
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+            if steps is not None:
+                cell = grid.cell(current)
+                steps.visit(cell, self._parent_cell(parent, current))
+                yield steps.record(cell, heuristic=self.heuristic(cell))
 
-            if current == self.end:
-                end_time = time.time()
+            if current == end:
                 return {
-                    'path': path,
-                    'nodes_explored': len(visited),
-                    'path_length': len(path),
-                    'time': end_time - start_time,
-                    'algorithm': 'Greedy Best-First',
-                    'steps': steps
+                    'path': self._walk_parents(parent, current),
+                    'nodes_explored': explored,
+                    'peak_frontier': peak_frontier
                 }
 
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    heapq.heappush(heap, (self.heuristic(
-                        neighbor), neighbor, path + [neighbor]))
+            if probe is not None:
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                # The heuristic ignores the route taken, so the first parent
+                # found for a cell is as good as any later one
+                if parent[neighbor] < 0:
+                    parent[neighbor] = current
+                    row, col = divmod(neighbor, cols)
+                    push(
+                        heap, (abs(row - end_row) + abs(col - end_col), neighbor))
 
         return None
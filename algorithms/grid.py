@@ -0,0 +1,227 @@
+from array import array
+from collections import OrderedDict
+import hashlib
+import numpy as np
+
+# Neighbor bits, in the order solvers have always visited them
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+NO_PARENT = -1
+BLOCK_ROWS = 1024  # Rows per block when building the tables
+
+
+def neighbor_masks(is_open):
+    """4-bit set of open neighbors for every cell of a boolean grid"""
+    mask = np.zeros(is_open.shape, dtype=np.uint8)
+    mask[1:, :] |= is_open[:-1, :] * np.uint8(UP)
+    mask[:-1, :] |= is_open[1:, :] * np.uint8(DOWN)
+    mask[:, 1:] |= is_open[:, :-1] * np.uint8(LEFT)
+    mask[:, :-1] |= is_open[:, 1:] * np.uint8(RIGHT)
+    mask[~is_open] = 0  # Walls have no moves
+    return mask
+
+
+class GraphCache:
+    """LRU cache of graphs derived from Grids (e.g. JunctionGraph).
+
+    Entries are keyed by the Grid's content digest plus any extra key
+    parts, so equal mazes share a graph. A graph reads its own Grid's
+    tables, so an entry is only handed out while that Grid still has the
+    digest it was built for, and Grid.toggle evicts the graphs built on
+    the Grid it edits.
+    """
+    _caches = []  # Every GraphCache, for Grid.toggle to evict from
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        GraphCache._caches.append(self)
+
+    def get(self, build, grid, *key):
+        """The graph cached for grid and key, else build() cached"""
+        key = (grid.digest(),) + key
+        graph = self.entries.get(key)
+        if graph is None or graph.grid.digest() != key[0]:
+            graph = self.entries[key] = build()
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        self.entries.move_to_end(key)
+        return graph
+
+    @classmethod
+    def forget(cls, grid):
+        """Drop every cached graph built on grid"""
+        for cache in cls._caches:
+            for key in [key for key, graph in cache.entries.items()
+                        if graph.grid is grid]:
+                del cache.entries[key]
+
+
+class Grid:
+    """Flat, int-indexed form of a maze, built once and shared by solvers.
+
+    Cell (row, col) gets the id row * cols + col. ``open`` holds one byte
+    per cell (1 = open) and ``mask`` one 4-bit set of open neighbors per
+    cell, so ``moves[mask[i]]`` is the tuple of id offsets to step from
+    cell i to each neighbor. Pass the same Grid to several solvers (in
+    place of the maze) to build the table only once.
+
+    ``costs`` optionally gives terrain: a positive integer per cell, the
+    cost of stepping onto it (walls are ignored). Dijkstra, Uniform Cost
+    Search, A*, Dial Dijkstra and Bidirectional Dijkstra/A* minimise it;
+    the other solvers keep counting steps. Without costs every step
+    costs 1.
+    """
+    costs = None  # Flat array('i') of step costs, None for unit costs
+    min_cost = max_cost = 1
+
+    def __init__(self, maze, costs=None):
+        # maze may be any 2D 0/1 array-like, including a read-only
+        # np.memmap; it is kept as given, not copied
+        cells = np.asarray(maze)
+        self.maze = maze
+        self.rows, self.cols = cells.shape
+        self.size = self.rows * self.cols
+        self.open = bytearray(self.size)
+        self.mask = bytearray(self.size)
+
+        # Fill the tables a block of rows at a time, so the temporaries
+        # stay small next to a huge (possibly memory-mapped) maze
+        open_rows = np.frombuffer(self.open, dtype=np.uint8).reshape(cells.shape)
+        mask_rows = np.frombuffer(self.mask, dtype=np.uint8).reshape(cells.shape)
+        for top in range(0, self.rows, BLOCK_ROWS):
+            bottom = min(top + BLOCK_ROWS, self.rows)
+            above = min(top, 1)  # One row of context on either side
+            is_open = cells[top - above:bottom + 1] == 0
+            inner = slice(above, above + bottom - top)
+            open_rows[top:bottom] = is_open[inner]
+            mask_rows[top:bottom] = neighbor_masks(is_open)[inner]
+        self._build_moves()
+        if costs is not None:
+            self._set_costs(costs)
+
+    def _set_costs(self, costs):
+        costs = np.asarray(costs)
+        if costs.shape != (self.rows, self.cols):
+            raise ValueError(f"costs shape {costs.shape} does not match the "
+                             f"maze's {(self.rows, self.cols)}")
+        open_costs = costs[np.frombuffer(self.open, dtype=bool).reshape(costs.shape)]
+        if open_costs.size and open_costs.min() < 1:
+            raise ValueError("step costs must be positive integers")
+        self.costs = array('i', costs.astype(np.int32).ravel().tobytes())
+        if open_costs.size:
+            self.min_cost, self.max_cost = int(open_costs.min()), int(open_costs.max())
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a Grid from an iterable of 0/1 rows (e.g. a generator or
+        a pipe), one row at a time, without a nested list of the maze"""
+        grid = cls.__new__(cls)
+        cells, grid.open, grid.mask = bytearray(), bytearray(), bytearray()
+        above = current = None
+        count = 0
+        for row in rows:
+            if isinstance(row, (bytes, bytearray, memoryview)):
+                row = np.frombuffer(row, dtype=np.uint8)  # Raw bytes, as read_rows gives
+            else:
+                row = np.asarray(row, dtype=np.uint8)
+            cells += row.tobytes()
+            if current is not None:
+                grid._add_row(above, current, row)
+            above, current = current, row
+            count += 1
+        grid._add_row(above, current, None)
+
+        grid.rows, grid.cols = count, len(current)
+        grid.size = count * grid.cols
+        grid.maze = np.frombuffer(cells, dtype=np.uint8).reshape(count, grid.cols)
+        grid._build_moves()
+        return grid
+
+    def _add_row(self, above, row, below):
+        """Append one row of open flags and neighbor masks"""
+        window = [cells for cells in (above, row, below) if cells is not None]
+        at = 0 if above is None else 1
+        is_open = np.stack(window) == 0
+        self.open += is_open[at].tobytes()
+        self.mask += neighbor_masks(is_open)[at].tobytes()
+
+    def _build_moves(self):
+        self.offsets = {UP: -self.cols, DOWN: self.cols, LEFT: -1, RIGHT: 1}
+        self.moves = tuple(tuple(delta for bit, delta in self.offsets.items()
+                                 if bits & bit)
+                           for bits in range(16))
+
+    @classmethod
+    def of(cls, maze, costs=None):
+        """Return maze itself if it is already a Grid, else build one;
+        costs, if given, always builds a new Grid carrying them"""
+        if costs is not None:
+            return cls(maze.maze if isinstance(maze, cls) else maze, costs)
+        return maze if isinstance(maze, cls) else cls(maze)
+
+    def digest(self):
+        """Hex hash of the maze's shape, open cells and step costs, computed once;
+        equal mazes give equal digests whatever object holds them"""
+        if getattr(self, '_digest', None) is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(f"{self.rows}x{self.cols}:".encode())
+            h.update(self.open)
+            if self.costs is not None:  # Terrain changes the paths too
+                h.update(b"costs:")
+                h.update(self.costs.tobytes())
+            self._digest = h.hexdigest()
+        return self._digest
+
+    def toggle(self, cells):
+        """Flip each (row, col) between wall and open, in the tables and in
+        the maze itself (so it must be writable); returns the flat ids
+        whose moves changed: every toggled cell and its neighbors"""
+        touched = set()
+        for row, col in cells:
+            index = self.index((row, col))
+            self.open[index] ^= 1
+            self.maze[row][col] = 0 if self.open[index] else 1
+            touched.add(index)
+            if row > 0:
+                touched.add(index - self.cols)
+            if row < self.rows - 1:
+                touched.add(index + self.cols)
+            if col > 0:
+                touched.add(index - 1)
+            if col < self.cols - 1:
+                touched.add(index + 1)
+        for index in touched:
+            self.mask[index] = self._mask_at(index)
+        self._digest = None  # The maze changed, so must its hash
+        GraphCache.forget(self)
+        return touched
+
+    def _mask_at(self, index):
+        """Neighbor bits of one cell, read from the open table"""
+        if not self.open[index]:
+            return 0
+        row, col = divmod(index, self.cols)
+        bits = 0
+        if row > 0 and self.open[index - self.cols]:
+            bits |= UP
+        if row < self.rows - 1 and self.open[index + self.cols]:
+            bits |= DOWN
+        if col > 0 and self.open[index - 1]:
+            bits |= LEFT
+        if col < self.cols - 1 and self.open[index + 1]:
+            bits |= RIGHT
+        return bits
+
+    def index(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def cell(self, index):
+        return divmod(index, self.cols)
+
+    def new_parents(self):
+        """Flat parent array with every cell unvisited"""
+        return array('i', [NO_PARENT]) * self.size
+
+    def new_costs(self, fill=2 ** 31 - 1):
+        """Flat cost array with every cell at fill (unreached by default)"""
+        return array('i', [fill]) * self.size
@@ -0,0 +1,203 @@
+import time
+from array import array
+from collections import deque
+import numpy as np
+from .base_solver import BaseSolver
+from .grid import GraphCache
+
+
+class ClusterGraph:
+    """Abstract graph for HPA*: the maze cut into square clusters.
+
+    Every pair of open cells facing each other across a cluster border is
+    an entrance; both cells become abstract nodes, joined by an edge of
+    cost 1. Inside each cluster, a BFS bounded to the cluster links each
+    node to the others with their exact distance. Because every crossing
+    is kept, a shortest path through the abstract graph is a shortest
+    path through the maze. Build once per (maze, cluster_size) with
+    ClusterGraph.of(); it is reused by every later query.
+    """
+    _cache = GraphCache(4)
+
+    def __init__(self, grid, cluster_size=16):
+        build_start = time.perf_counter_ns()
+        self.grid = grid
+        self.cluster_size = size = cluster_size
+        rows, cols = grid.rows, grid.cols
+        self.cluster_cols = -(-cols // size)
+
+        row_ids = np.arange(rows) // size
+        col_ids = np.arange(cols) // size
+        cluster_of = row_ids[:, None] * self.cluster_cols + col_ids[None, :]
+        self.cluster_of = array('i', cluster_of.astype(np.int32).tobytes())
+
+        # Entrances: open cells facing each other across a border
+        is_open = np.frombuffer(grid.open, dtype=np.uint8).reshape(rows, cols) == 1
+        self.edges = {}
+        borders = np.arange(size, cols, size)
+        r, k = np.nonzero(is_open[:, borders - 1] & is_open[:, borders])
+        for left in (r * cols + borders[k] - 1).tolist():
+            self._link(left, left + 1, 1)
+        borders = np.arange(size, rows, size)
+        k, c = np.nonzero(is_open[borders - 1, :] & is_open[borders, :])
+        for top in ((borders[k] - 1) * cols + c).tolist():
+            self._link(top, top + cols, 1)
+
+        self.members = {}
+        for node in self.edges:
+            self.members.setdefault(self.cluster_of[node], []).append(node)
+        for cluster, nodes in self.members.items():
+            for node in nodes:
+                dist, _ = self.local_bfs(node, nodes)
+                for other in nodes:
+                    if other != node and other in dist:
+                        self.edges[node].append((other, dist[other]))
+        self.build_time_ns = time.perf_counter_ns() - build_start
+
+    @classmethod
+    def of(cls, grid, cluster_size=16):
+        """The (cached) cluster graph of a Grid"""
+        return cls._cache.get(lambda: cls(grid, cluster_size), grid, cluster_size)
+
+    def _link(self, a, b, cost):
+        self.edges.setdefault(a, []).append((b, cost))
+        self.edges.setdefault(b, []).append((a, cost))
+
+    def local_bfs(self, source, targets=(), stop=-1):
+        """BFS from source that never leaves its cluster; stops once every
+        target (or stop) is reached. Returns (distances, parents) dicts."""
+        mask, moves, cluster_of = self.grid.mask, self.grid.moves, self.cluster_of
+        cluster = cluster_of[source]
+        remaining = set(targets)
+        remaining.discard(source)
+        dist, parent = {source: 0}, {source: source}
+        queue = deque([source])
+        while queue and (remaining or (stop >= 0 and stop not in parent)):
+            current = queue.popleft()
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                if neighbor not in dist and cluster_of[neighbor] == cluster:
+                    dist[neighbor] = dist[current] + 1
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+                    remaining.discard(neighbor)
+        return dist, parent
+
+    def local_path(self, source, target):
+        """Shortest path of cell ids from source to target inside a cluster"""
+        _, parent = self.local_bfs(source, stop=target)
+        path = [target]
+        while path[-1] != source:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+
+class HPAStar(BaseSolver):
+    """Hierarchical A* (HPA*) over a ClusterGraph.
+
+    Start and end are linked to the entrances of their clusters, A* runs
+    on the small abstract graph, and only the clusters on the chosen
+    route are searched cell by cell to refine it. The precomputed
+    ClusterGraph is shared by every query on the same maze.
+    """
+    name = 'HPA*'
+
+    def __init__(self, maze, start, end, cluster_size=16):
+        super().__init__(maze, start, end)
+        self.cluster_size = cluster_size
+
+    def _search(self, steps):
+        """A* on the abstract graph, recording each expanded entrance"""
+        grid = self.grid
+        graph = ClusterGraph.of(grid, self.cluster_size)
+        cluster_of, members = graph.cluster_of, graph.members
+        start, end = grid.index(self.start), grid.index(self.end)
+        end_row, end_col = self.end
+        cols = grid.cols
+        if not grid.open[start] or not grid.open[end]:
+            return None
+        if start == end:
+            return {'path': [self.start], 'nodes_explored': 1, 'peak_frontier': 1}
+
+        # Link the end into its cluster: node -> distance to the end
+        end_nodes = members.get(cluster_of[end], [])
+        end_dist, _ = graph.local_bfs(end, end_nodes + [start])
+        explored = len(end_dist)
+        to_end = {node: end_dist[node] for node in end_nodes if node in end_dist}
+
+        best_end, end_parent = float('inf'), None
+        if start in end_dist:  # Same cluster, straight across
+            best_end, end_parent = end_dist[start], start
+        best, parent = {start: 0}, {start: None}
+        heap = [(0, 0, start)]
+        closed = set()
+        peak_frontier = 1
+        push, pop = self._heap_ops()
+        probe = self.instrumentation  # None unless instrumented
+
+        while heap:
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            priority, cost, node = pop(heap)
+            if priority >= best_end:
+                break
+            if node in closed:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(node))
+                continue
+
+            closed.add(node)
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(node))
+            if steps is not None:
+                before = parent[node]
+                steps.visit(grid.cell(node), None if before is None else grid.cell(before))
+                yield steps.record(grid.cell(node), cost=cost)
+
+            if node in to_end and cost + to_end[node] < best_end:
+                best_end, end_parent = cost + to_end[node], node
+
+            if node == start and start not in graph.edges:
+                # Link the start into its cluster for this query only
+                start_nodes = members.get(cluster_of[start], [])
+                start_dist, _ = graph.local_bfs(start, start_nodes)
+                explored += len(start_dist)
+                links = [(other, start_dist[other]) for other in start_nodes
+                         if other in start_dist]
+            else:
+                links = graph.edges[node]
+
+            if probe is not None:
+                probe.emit('neighbor_check', grid.cell(node), len(links))
+            for other, length in links:
+                new_cost = cost + length
+                if new_cost < best.get(other, best_end):
+                    best[other], parent[other] = new_cost, node
+                    row, col = divmod(other, cols)
+                    priority = new_cost + abs(row - end_row) + abs(col - end_col)
+                    push(heap, (priority, new_cost, other))
+
+        if end_parent is None:
+            return None
+
+        # Refine: walk each abstract step, searching only its cluster
+        route = [end, end_parent]
+        while parent[route[-1]] is not None:
+            route.append(parent[route[-1]])
+        route.reverse()
+        path = [start]
+        for a, b in zip(route, route[1:]):
+            if a == b:
+                continue
+            if cluster_of[a] != cluster_of[b]:
+                path.append(b)
+            else:
+                path.extend(graph.local_path(a, b)[1:])
+        explored += len(path)
+        return {
+            'path': [grid.cell(index) for index in path],
+            'nodes_explored': explored,
+            'peak_frontier': peak_frontier
+        }
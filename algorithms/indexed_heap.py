@@ -0,0 +1,84 @@
+class IndexedHeap:
+    """Binary min-heap of entry tuples, at most one entry per cell.
+
+    Entries are ordered like heapq's (e.g. (priority, cost, cell)) and the
+    last field is the cell id. A position dict maps each queued cell to
+    its slot, so pushing a cell that is already queued lowers its entry in
+    place (decrease-key) instead of adding a duplicate: the heap never
+    grows past the number of queued cells, and no stale entries are left
+    to pop. Its memory follows the frontier, not the grid; the solvers'
+    'peak_frontier' is its largest size.
+
+    push and pop take the heap first, so ``IndexedHeap.push`` and
+    ``IndexedHeap.pop`` stand in for heapq.heappush and heapq.heappop,
+    and heap[0] is the smallest entry, as with a heapq list.
+    """
+
+    def __init__(self, entries=()):
+        self.entries = []
+        self.position = {}  # Queued cell -> slot in entries
+        for entry in entries:
+            self.push(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, cell):
+        return cell in self.position
+
+    def __getitem__(self, slot):
+        return self.entries[slot]
+
+    def push(self, entry):
+        """Queue entry's cell, or lower its entry if it is queued with a
+        higher one; returns False when the heap was left as it was"""
+        entries, position = self.entries, self.position
+        cell = entry[-1]
+        slot = position.get(cell)
+        if slot is None:
+            slot = len(entries)
+            entries.append(entry)
+        elif not entry < entries[slot]:
+            return False
+
+        # Sift up: move parents down into the hole until entry fits
+        while slot:
+            up = (slot - 1) >> 1
+            parent = entries[up]
+            if entry >= parent:
+                break
+            entries[slot] = parent
+            position[parent[-1]] = slot
+            slot = up
+        entries[slot] = entry
+        position[cell] = slot
+        return True
+
+    def pop(self):
+        """Remove and return the smallest entry"""
+        entries, position = self.entries, self.position
+        top = entries[0]
+        del position[top[-1]]
+        last = entries.pop()
+        if not entries:
+            return top
+
+        # Sift down: move the smaller child up into the hole until the
+        # last entry fits
+        size = len(entries)
+        slot = 0
+        child = 1
+        while child < size:
+            right = child + 1
+            if right < size and entries[right] < entries[child]:
+                child = right
+            smaller = entries[child]
+            if last <= smaller:
+                break
+            entries[slot] = smaller
+            position[smaller[-1]] = slot
+            slot = child
+            child = 2 * slot + 1
+        entries[slot] = last
+        position[last[-1]] = slot
+        return top
@@ -0,0 +1,75 @@
+import cProfile
+import heapq
+import io
+import pstats
+from collections import Counter
+
+
+class Instrumentation:
+    """Event counters and callbacks for one or more solver runs.
+
+    Attach with ``solver.instrument(probe)``. Solvers report:
+
+    - 'expand': a cell taken off the frontier and expanded
+    - 'neighbor_check': neighbors examined (counted per expansion)
+    - 'heap_push' / 'heap_pop': priority queue operations (with an
+      IndexedHeap a push may be a decrease-key)
+    - 'stale_skip': a popped heap entry for an already-closed cell
+    - 'reopen': a cell pushed again with a lower cost
+    - 'layer_cells': a whole BFS layer expanded at once, counted in its
+      cells (Wavefront BFS, Bitset BFS and Bidirectional BFS; the last
+      reports the frontier side it expands)
+
+    Callbacks registered with ``on(event, callback)`` are called as
+    ``callback(event, cell, count)``. An uninstrumented solver runs the
+    plain heapq functions and skips every report behind a ``None`` check,
+    so instrumentation costs nothing measurable when it is off.
+    """
+
+    def __init__(self):
+        self.counters = Counter()
+        self.callbacks = {}
+
+    def on(self, event, callback):
+        self.callbacks.setdefault(event, []).append(callback)
+        return self
+
+    def emit(self, event, cell=None, count=1):
+        self.counters[event] += count
+        for callback in self.callbacks.get(event, ()):
+            callback(event, cell, count)
+
+    def heap_ops(self, heappush=heapq.heappush, heappop=heapq.heappop):
+        """Replacements for a (push, pop) pair that report each operation"""
+        emit = self.emit
+
+        def push(heap, item):
+            emit('heap_push')
+            heappush(heap, item)
+
+        def pop(heap):
+            emit('heap_pop')
+            return heappop(heap)
+
+        return push, pop
+
+    def export(self):
+        """Counters as a plain dict, ready for JSON"""
+        return dict(self.counters)
+
+
+def profile_solver(solver, path=None, sort='cumulative', limit=25):
+    """Run solver.solve() under cProfile.
+
+    Writes the raw stats to path (loadable with pstats or snakeviz) when
+    given, prints the top entries and returns (result, pstats.Stats).
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(solver.solve)
+    if path:
+        profiler.dump_stats(path)
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output).sort_stats(sort)
+    stats.print_stats(limit)
+    print(output.getvalue())
+    return result, stats
@@ -1,48 +1,145 @@
-import heapq
-import time
 from .base_solver import BaseSolver
+from .grid import UP, DOWN, LEFT, RIGHT
 
 
 class JumpPointSearch(BaseSolver):
-    def solve_with_steps(self):
-        """Simplified Jump Point Search with step-by-step visualization data"""
-        start_time = time.time()
-        heap = [(self.heuristic(self.start), 0, self.start, [self.start])]
-        visited = set()
-        steps = []
+    """Jump Point Search for 4-connected grids.
+
+    Instead of pushing every neighbor, each expansion jumps along straight
+    lines and only stops at jump points: the goal, cells with a forced
+    neighbor (an opening to the side that did not exist one cell back), and
+    cells on a vertical run from which a horizontal jump finds one. Only
+    jump points enter the heap; the straight segments between them are
+    filled back in when the path is rebuilt.
+    """
+    name = 'Jump Point Search'
+
+    def _search(self, steps):
+        """JPS, recording each expanded jump point when steps is given"""
+        grid = self.grid
+        cols, offsets = grid.cols, grid.offsets
+        start, end = grid.index(self.start), grid.index(self.end)
+        end_row, end_col = self.end
+        best = grid.new_costs()
+        parent = grid.new_parents()
+        probe = self.instrumentation  # None unless instrumented
+        visited = bytearray(grid.size)
+        best[start] = 0
+        parent[start] = start
+        explored = 0
+        heap, push, pop = self._new_heap([(self.heuristic(self.start), 0, start)])
+        peak_frontier = 1
 
         while heap:
-            _, cost, current, path = heapq.heappop(heap)
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            _, cost, current = pop(heap)
 
-            if current in visited:
+            if visited[current]:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(current))
                 continue
 
-            visited.add(current)
-            steps.append({
-                'current': current,
-                'visited': visited.copy(),
-                'path': path.copy(),
-                'cost': cost
-            })
+            visited[current] = 1
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+            if steps is not None:
+                steps.visit(grid.cell(current), self._parent_cell(parent, current))
+                yield steps.record(grid.cell(current), cost=cost)
 
-            if current == self.end:
-                end_time = time.time()
+            if current == end:
                 return {
-                    'path': path,
-                    'nodes_explored': len(visited),
-                    'path_length': len(path),
-                    'time': end_time - start_time,
-                    'algorithm': 'Jump Point Search',
-                    'steps': steps
+                    'path': self._expand_path(parent, current),
+                    'nodes_explored': explored,
+                    'peak_frontier': peak_frontier
                 }
 
-            # Simplified jump point logic - just check neighbors but skip some
-            for neighbor in self.get_neighbors(current):
-                if neighbor not in visited:
-                    # Simple pruning: don't explore if there's a shorter path
-                    new_cost = cost + 1
-                    priority = new_cost + self.heuristic(neighbor)
-                    heapq.heappush(heap, (priority, new_cost,
-                                   neighbor, path + [neighbor]))
+            directions = self._pruned_directions(current, parent[current])
+            if probe is not None:
+                probe.emit('neighbor_check', grid.cell(current), len(directions))
+            for bit in directions:
+                delta = offsets[bit]
+                if bit & (LEFT | RIGHT):
+                    jump_point = self._jump_horizontal(current + delta, delta, end)
+                    distance = abs(jump_point - current)
+                else:
+                    jump_point = self._jump_vertical(current + delta, delta, end)
+                    distance = abs(jump_point - current) // cols
+                if jump_point < 0:
+                    continue
+
+                new_cost = cost + distance
+                if new_cost < best[jump_point]:
+                    best[jump_point] = new_cost
+                    parent[jump_point] = current
+                    row, col = divmod(jump_point, cols)
+                    priority = new_cost + abs(row - end_row) + abs(col - end_col)
+                    push(heap, (priority, new_cost, jump_point))
 
         return None
+
+    def _pruned_directions(self, current, parent):
+        """Open directions worth jumping in, given how we arrived here"""
+        if parent == current:
+            candidates = (UP, DOWN, LEFT, RIGHT)
+        elif abs(current - parent) < self.cols:
+            # Arrived horizontally: keep going, or turn up/down
+            forward = RIGHT if current > parent else LEFT
+            candidates = (UP, DOWN, forward)
+        else:
+            # Arrived vertically: keep going, or turn left/right
+            forward = DOWN if current > parent else UP
+            candidates = (forward, LEFT, RIGHT)
+        open_bits = self.grid.mask[current]
+        return [bit for bit in candidates if open_bits & bit]
+
+    def _jump_horizontal(self, cell, delta, end):
+        """Walk left/right from cell; return the jump point found or -1"""
+        mask = self.grid.mask
+        ahead = RIGHT if delta > 0 else LEFT
+        while True:
+            if cell == end:
+                return cell
+            here, behind = mask[cell], mask[cell - delta]
+            # Forced neighbor: an opening above/below that was walled off
+            # one cell back
+            if (here & UP and not behind & UP) or (here & DOWN and not behind & DOWN):
+                return cell
+            if not here & ahead:
+                return -1
+            cell += delta
+
+    def _jump_vertical(self, cell, delta, end):
+        """Walk up/down from cell; return the jump point found or -1"""
+        mask = self.grid.mask
+        ahead = DOWN if delta > 0 else UP
+        while True:
+            if cell == end:
+                return cell
+            here, behind = mask[cell], mask[cell - delta]
+            if (here & LEFT and not behind & LEFT) or (here & RIGHT and not behind & RIGHT):
+                return cell
+            # Stop where a horizontal jump would reach a jump point, so the
+            # turn is expanded from here
+            if here & LEFT and self._jump_horizontal(cell - 1, -1, end) >= 0:
+                return cell
+            if here & RIGHT and self._jump_horizontal(cell + 1, 1, end) >= 0:
+                return cell
+            if not here & ahead:
+                return -1
+            cell += delta
+
+    def _expand_path(self, parent, index):
+        """Rebuild the cell-by-cell path, filling in the jumps"""
+        jump_points = self._walk_parents(parent, index)
+        path = [jump_points[0]]
+        for row, col in jump_points[1:]:
+            prev_row, prev_col = path[-1]
+            step_row = (row > prev_row) - (row < prev_row)
+            step_col = (col > prev_col) - (col < prev_col)
+            while (prev_row, prev_col) != (row, col):
+                prev_row += step_row
+                prev_col += step_col
+                path.append((prev_row, prev_col))
+        return path
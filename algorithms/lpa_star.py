@@ -0,0 +1,122 @@
+from .base_solver import BaseSolver
+
+INF = 2 ** 31 - 1
+
+
+class LPAStar(BaseSolver):
+    """Lifelong Planning A*: A* that keeps its search between solves.
+
+    The first solve() is a full A* search. After toggle() opens or closes
+    cells, the next solve() repairs only the part of the search the edit
+    affected, so 'nodes_explored' counts the re-expanded cells alone.
+    """
+    name = 'LPA*'
+
+    def __init__(self, maze, start, end):
+        super().__init__(maze, start, end)
+        grid = self.grid
+        self.g = grid.new_costs(INF)    # Settled cost of each cell
+        self.rhs = grid.new_costs(INF)  # One-step lookahead cost
+        self.heap = []
+        self.pending = {grid.index(start)}  # Cells to recheck next solve
+        self.total_expanded = 0  # Over every solve so far
+        self.rhs[grid.index(start)] = 0
+
+    def toggle(self, cells):
+        """Open or close each (row, col); the next solve() rechecks the
+        cells whose moves changed and repairs the search from there"""
+        self.pending.update(self.grid.toggle(cells))
+
+    def _search(self, steps):
+        """Expand inconsistent cells until the end's cost is settled"""
+        grid = self.grid
+        mask, moves, cols = grid.mask, grid.moves, grid.cols
+        g, rhs, heap = self.g, self.rhs, self.heap
+        start, end = grid.index(self.start), grid.index(self.end)
+        end_row, end_col = self.end
+        push, pop = self._heap_ops()
+        probe = self.instrumentation  # None unless instrumented
+
+        def update(index):
+            # Recompute the lookahead cost from the neighbors and queue
+            # the cell, keyed like A*, if it is now inconsistent
+            if index != start:
+                best = INF - 1
+                for move in moves[mask[index]]:
+                    if g[index + move] < best:
+                        best = g[index + move]
+                rhs[index] = best + 1
+            cost = g[index]
+            if cost != rhs[index]:
+                if rhs[index] < cost:
+                    cost = rhs[index]
+                row, col = divmod(index, cols)
+                push(heap, (cost + abs(row - end_row) + abs(col - end_col), cost, index))
+
+        for index in self.pending:
+            update(index)
+        self.pending = set()
+        explored = 0
+        peak_frontier = len(heap)
+
+        while heap:
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            end_cost = min(g[end], rhs[end])
+            if g[end] == rhs[end] and heap[0][:2] >= (end_cost, end_cost):
+                break  # The end is settled and no cheaper cell is left
+            priority, cost, current = pop(heap)
+            # Entries stay queued when a cell's key changes; only the one
+            # matching the current key of an inconsistent cell counts
+            if g[current] == rhs[current] or cost != min(g[current], rhs[current]):
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(current))
+                continue
+
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            if steps is not None:
+                cell = grid.cell(current)
+                steps.visit(cell, self._best_neighbor(current))
+                yield steps.record(cell, cost=cost,
+                                   heuristic=self.heuristic(cell))
+
+            if g[current] > rhs[current]:
+                g[current] = rhs[current]  # Cost went down: settle it
+            else:
+                g[current] = INF  # Cost went up: reopen it and its successors
+                update(current)
+            for move in moves[mask[current]]:
+                update(current + move)
+
+        self.total_expanded += explored
+        if g[end] == INF or not grid.open[start]:
+            return None
+
+        # Walk back along neighbors one cheaper than the current cell
+        path = [end]
+        current = end
+        while current != start:
+            for move in moves[mask[current]]:
+                if g[current + move] == g[current] - 1:
+                    current += move
+                    break
+            path.append(current)
+        path.reverse()
+        return {
+            'path': [grid.cell(index) for index in path],
+            'nodes_explored': explored,
+            'peak_frontier': peak_frontier
+        }
+
+    def _best_neighbor(self, index):
+        """(row, col) of the cheapest settled neighbor, None if none is"""
+        grid = self.grid
+        best, cell = INF, None
+        for move in grid.moves[grid.mask[index]]:
+            if self.g[index + move] < best:
+                best, cell = self.g[index + move], grid.cell(index + move)
+        return cell
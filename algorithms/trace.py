@@ -0,0 +1,128 @@
+from collections.abc import Set
+from itertools import islice
+
+
+class VisitedView(Set):
+    """Read-only view of the visited set as it was at one step"""
+    __slots__ = ('_tree', '_count')
+
+    def __init__(self, tree, count):
+        self._tree = tree
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, cell):
+        position = self._tree.index.get(cell)
+        return position is not None and position < self._count
+
+    def __iter__(self):
+        return islice(self._tree.order, self._count)
+
+    def since(self, count):
+        """Cells visited after the first count, in visit order"""
+        return self._tree.order[count:self._count]
+
+
+class _SearchTree:
+    """Cells in the order they were visited, plus their parent pointers"""
+    __slots__ = ('order', 'index', 'parent')
+
+    def __init__(self):
+        self.order = []
+        self.index = {}
+        self.parent = {}
+
+
+class StepTrace:
+    """Compact step-by-step record of a search.
+
+    Instead of copying the whole visited set and path on every step, the
+    trace stores each newly visited cell once (with its parent) and, per
+    step, only the current cell, how many cells were visited at that point
+    and the solver's extra info. Indexing a trace rebuilds the same step
+    dict the solvers used to append to their ``steps`` list, so it can be
+    read exactly like that list.
+    """
+
+    def __init__(self):
+        self._trees = {}
+        self._steps = []
+
+    def _tree(self, direction):
+        tree = self._trees.get(direction)
+        if tree is None:
+            tree = self._trees[direction] = _SearchTree()
+        return tree
+
+    def visit(self, cell, parent=None, direction='forward'):
+        """Add a cell to the visited set of one search direction"""
+        tree = self._tree(direction)
+        if cell in tree.index:
+            return
+        tree.index[cell] = len(tree.order)
+        tree.order.append(cell)
+        tree.parent[cell] = parent
+
+    def record(self, current, **info):
+        """Record a step; ``direction`` in info selects the search tree"""
+        direction = info.get('direction', 'forward')
+        count = len(self._tree(direction).order)
+        self._steps.append((current, count, info))
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __iter__(self):
+        for index in range(len(self._steps)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._steps)
+        current, count, info = self._steps[index]
+        tree = self._tree(info.get('direction', 'forward'))
+        step = {
+            'current': current,
+            'visited': VisitedView(tree, count),
+            'path': self._path(tree, current)
+        }
+        step.update(info)
+        return step
+
+    def _path(self, tree, cell):
+        """Walk parent pointers back from a cell to the root of its tree"""
+        path = []
+        parent = tree.parent
+        while cell is not None:
+            path.append(cell)
+            cell = parent.get(cell)
+        path.reverse()
+        return path
+
+
+class StepStream:
+    """Turns a solver's visit/record calls into standalone step events.
+
+    Used by BaseSolver.solve_iter(): nothing is stored beyond the cells
+    visited since the last event, so a consumer can animate or analyse a
+    search of any length in constant memory.
+    """
+
+    def __init__(self):
+        self._pending = {}
+
+    def visit(self, cell, parent=None, direction='forward'):
+        """Queue a newly visited cell for the next event of its direction"""
+        self._pending.setdefault(direction, []).append((cell, parent))
+
+    def record(self, current, **info):
+        """Build the event for one step"""
+        direction = info.get('direction', 'forward')
+        event = {
+            'current': current,
+            'new_visited': self._pending.pop(direction, [])
+        }
+        event.update(info)
+        return event
@@ -1,47 +1,62 @@
-import heapq
-import time
 from .base_solver import BaseSolver
 
 
 class UniformCostSearch(BaseSolver):
-    def solve_with_steps(self):
-        """Uniform Cost Search with step-by-step visualization data"""
-        start_time = time.time()
-        heap = [(0, self.start, [self.start])]
-        visited = set()
-        cost_so_far = {self.start: 0}
-        steps = []
+    name = 'Uniform Cost Search'
+
+    def _search(self, steps):
+        """Uniform Cost Search, recording each step when steps is given"""
+        grid = self.grid
+        mask, moves, costs = grid.mask, grid.moves, grid.costs
+        start, end = grid.index(self.start), grid.index(self.end)
+        cost_so_far = grid.new_costs()
+        parent = grid.new_parents()
+        probe = self.instrumentation  # None unless instrumented
+        visited = bytearray(grid.size)
+        cost_so_far[start] = 0
+        parent[start] = start
+        explored = 0
+        heap, push, pop = self._new_heap([(0, start)])
+        peak_frontier = 1
 
         while heap:
-            cost, current, path = heapq.heappop(heap)
+            if len(heap) > peak_frontier:
+                peak_frontier = len(heap)
+            cost, current = pop(heap)
 
-            if current in visited:
+            if visited[current]:
+                if probe is not None:
+                    probe.emit('stale_skip', grid.cell(current))
                 continue
 
-            visited.add(current)
-            steps.append({
-                'current': current,
-                'visited': visited.copy(),
-                'path': path.copy(),
-                'cost': cost
-            })
+            visited[current] = 1
+            explored += 1
+            if probe is not None:
+                probe.emit('expand', grid.cell(current))
+            if steps is not None:
+                steps.visit(grid.cell(current), self._parent_cell(parent, current))
+                yield steps.record(grid.cell(current), cost=cost)
 
-            if current == self.end:
-                end_time = time.time()
+            if current == end:
                 return {
-                    'path': path,
-                    'nodes_explored': len(visited),
-                    'path_length': len(path),
-                    'time': end_time - start_time,
-                    'algorithm': 'Uniform Cost Search',
-                    'steps': steps
+                    'path': self._walk_parents(parent, current),
+                    'path_cost': cost,
+                    'nodes_explored': explored,
+                    'peak_frontier': peak_frontier
                 }
 
-            for neighbor in self.get_neighbors(current):
-                new_cost = cost + 1  # Uniform cost of 1 per step
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+            if probe is not None:
+                probe.emit('neighbor_check', grid.cell(current),
+                           len(moves[mask[current]]))
+            for move in moves[mask[current]]:
+                neighbor = current + move
+                # 1 per step, or the terrain cost of entering neighbor
+                new_cost = cost + (1 if costs is None else costs[neighbor])
+                if new_cost < cost_so_far[neighbor]:
+                    if probe is not None and parent[neighbor] >= 0:
+                        probe.emit('reopen', grid.cell(neighbor))
                     cost_so_far[neighbor] = new_cost
-                    heapq.heappush(
-                        heap, (new_cost, neighbor, path + [neighbor]))
+                    parent[neighbor] = current
+                    push(heap, (new_cost, neighbor))
 
         return None
@@ -0,0 +1,99 @@
+import numpy as np
+from .base_solver import BaseSolver
+
+
+class WavefrontBFS(BaseSolver):
+    """BFS that expands the whole frontier at once with NumPy.
+
+    The frontier is an array of flat cell ids; one layer shifts it by each
+    neighbor offset (-cols, +cols, -1, +1) where the neighbor mask allows,
+    drops cells that already have a distance and de-duplicates the rest.
+    The interpreter does O(1) work per layer instead of per cell. The
+    result carries the distance field (-1 for cells not reached) and the
+    path is recovered by walking downhill on it from the end. With
+    full_field=True the wave keeps going after the end is reached, giving
+    the distance to every reachable cell.
+    """
+    name = 'Wavefront BFS'
+
+    def __init__(self, maze, start, end, full_field=False):
+        super().__init__(maze, start, end)
+        self.full_field = full_field
+
+    def distance_field(self):
+        """Distance from start to every cell (-1 where unreachable)"""
+        dist, _, _ = self._drain(self._wave(None, full_field=True))
+        return dist.reshape(self.rows, self.cols)
+
+    def _search(self, steps):
+        """Wavefront BFS, recording one step per layer when steps is given"""
+        dist, explored, peak_frontier = yield from self._wave(steps, self.full_field)
+        grid = self.grid
+        start, end = grid.index(self.start), grid.index(self.end)
+        if dist[end] < 0:
+            return None
+
+        path = [end]
+        while path[-1] != start:
+            path.append(self._downhill(dist, path[-1]))
+        path.reverse()
+        return {
+            'path': [grid.cell(index) for index in path],
+            'nodes_explored': explored,
+            'peak_frontier': peak_frontier,
+            'distance_field': dist.reshape(self.rows, self.cols)
+        }
+
+    def _wave(self, steps, full_field):
+        """Expand layers until the end is reached (or, with full_field, until
+        the wave dies out); returns the flat distance array, cells reached
+        and the largest layer"""
+        grid = self.grid
+        mask = np.frombuffer(grid.mask, dtype=np.uint8)
+        shifts = list(grid.offsets.items())
+        start, end = grid.index(self.start), grid.index(self.end)
+        dist = np.full(grid.size, -1, dtype=np.int32)
+        dist[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        explored = 1
+        peak_frontier = 1
+        if steps is not None:
+            steps.visit(self.start)
+            yield steps.record(self.start, distance=0, frontier_size=1)
+
+        distance = 0
+        while len(frontier) and (full_field or dist[end] < 0):
+            bits = mask[frontier]
+            wave = np.concatenate([frontier[(bits & bit) != 0] + delta
+                                   for bit, delta in shifts])
+            wave = np.unique(wave[dist[wave] < 0])
+
+            distance += 1
+            dist[wave] = distance
+            explored += len(wave)
+            peak_frontier = max(peak_frontier, len(wave))
+            frontier = wave
+            if self.instrumentation is not None:
+                self.instrumentation.emit('layer_cells', count=len(wave))
+
+            if steps is not None and len(wave):
+                layer = wave.tolist()
+                for index in layer:
+                    steps.visit(grid.cell(index),
+                                grid.cell(self._downhill(dist, index)))
+                # Show the wave cell closest to the end as the current one
+                current = min((grid.cell(index) for index in layer),
+                              key=self.heuristic)
+                yield steps.record(current, distance=distance,
+                                   frontier_size=len(layer))
+
+        return dist, explored, peak_frontier
+
+    def _downhill(self, dist, index):
+        """A neighbor one step closer to the start"""
+        grid = self.grid
+        target = dist[index] - 1
+        for move in grid.moves[grid.mask[index]]:
+            if dist[index + move] == target:
+                return index + move
+        return None
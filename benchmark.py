@@ -0,0 +1,264 @@
+import argparse
+import csv
+import json
+import os
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+import algorithms
+from algorithms import AStar, BaseSolver, Grid, LPAStar
+from maze.array_maze_generator import ArrayMazeGenerator
+from maze.storage import MazeCache
+from maze.terrain import random_terrain
+
+FIELDS = ['algorithm', 'size', 'loop_factor', 'runs', 'median_ms', 'p95_ms',
+          'nodes_explored', 'path_length', 'nodes_per_sec', 'peak_frontier']
+
+
+def all_solvers():
+    """Every solver class exported in algorithms.__all__"""
+    solvers = []
+    for name in algorithms.__all__:
+        obj = getattr(algorithms, name)
+        if isinstance(obj, type) and issubclass(obj, BaseSolver) and obj is not BaseSolver:
+            solvers.append(obj)
+    return solvers
+
+
+def time_solver(solver_cls, grid, start, end, warmup, repeats, indexed_heap=False):
+    """Run warm-up solves, then timed ones; returns (seconds list, result)"""
+    for _ in range(warmup):
+        solver_cls(grid, start, end).use_indexed_heap(indexed_heap).solve()
+    times = []
+    result = None
+    for _ in range(repeats):
+        solver = solver_cls(grid, start, end).use_indexed_heap(indexed_heap)
+        began = time.perf_counter()
+        result = solver.solve()
+        times.append(time.perf_counter() - began)
+    return times, result
+
+
+def run_benchmark(sizes, loop_factors, seeds, solvers, warmup=1, repeats=3,
+                  cache=None, max_cost=1, indexed_heap=False):
+    """Sweep every solver over sizes x loop_factors x seeds; returns one
+    summary row per (solver, size, loop_factor). With max_cost > 1 each
+    maze gets random terrain costs 1..max_cost; with indexed_heap the
+    heap-based solvers queue with decrease-key"""
+    cache = cache or MazeCache()
+    rows = []
+    for size in sizes:
+        for loop_factor in loop_factors:
+            runs = {solver.name: {'times': [], 'nodes': [], 'paths': [], 'rates': [],
+                                  'frontiers': []}
+                    for solver in solvers}
+            for seed in range(seeds):
+                maze_gen = cache.get(ArrayMazeGenerator, size, size, loop_factor, seed)
+                costs = None
+                if max_cost > 1:
+                    costs = random_terrain(maze_gen.maze.shape, max_cost, seed)
+                grid = Grid(maze_gen.maze, costs)
+                for solver_cls in solvers:
+                    times, result = time_solver(solver_cls, grid, maze_gen.start,
+                                                maze_gen.end, warmup, repeats,
+                                                indexed_heap)
+                    run = runs[solver_cls.name]
+                    run['times'].extend(times)
+                    if result:
+                        run['nodes'].append(result['nodes_explored'])
+                        run['paths'].append(result['path_length'])
+                        run['rates'].append(result['nodes_explored'] / np.median(times))
+                        run['frontiers'].append(result['peak_frontier'])
+
+            for name, run in runs.items():
+                times = np.array(run['times']) * 1000
+                rows.append({
+                    'algorithm': name,
+                    'size': size,
+                    'loop_factor': loop_factor,
+                    'runs': len(times),
+                    'median_ms': round(float(np.median(times)), 4),
+                    'p95_ms': round(float(np.percentile(times, 95)), 4),
+                    'nodes_explored': float(np.median(run['nodes'])) if run['nodes'] else None,
+                    'path_length': float(np.median(run['paths'])) if run['paths'] else None,
+                    'nodes_per_sec': round(float(np.median(run['rates'])), 1) if run['rates'] else None,
+                    'peak_frontier': max(run['frontiers']) if run['frontiers'] else None
+                })
+                print(f"  {name:<22} size {size:<5} loops {loop_factor:<5} "
+                      f"median {rows[-1]['median_ms']:>10.3f} ms  p95 {rows[-1]['p95_ms']:>10.3f} ms")
+    return rows
+
+
+def run_replan(size, loop_factor, seeds, batches, edits, cache=None):
+    """Toggle edits random interior cells per batch and compare how many
+    cells LPA* re-expands to repair its search with a fresh A* run on the
+    edited maze; returns one row per batch"""
+    cache = cache or MazeCache()
+    rows = []
+    for seed in range(seeds):
+        maze_gen = cache.get(ArrayMazeGenerator, size, size, loop_factor, seed)
+        # Edits go into the maze itself, so work on a copy of the cached one
+        grid = Grid(np.array(maze_gen.maze))
+        rng = np.random.default_rng(seed)
+        solver = LPAStar(grid, maze_gen.start, maze_gen.end)
+        solver.solve()
+        for batch in range(batches):
+            cells = zip(rng.integers(1, grid.rows - 1, edits).tolist(),
+                        rng.integers(1, grid.cols - 1, edits).tolist())
+            solver.toggle(cells)
+            began = time.perf_counter()
+            repaired = solver.solve()
+            lpa_ms = (time.perf_counter() - began) * 1000
+            began = time.perf_counter()
+            full = AStar(grid, maze_gen.start, maze_gen.end).solve()
+            astar_ms = (time.perf_counter() - began) * 1000
+            rows.append({
+                'seed': seed,
+                'batch': batch,
+                'reachable': full is not None,
+                'reexpanded': repaired['nodes_explored'] if repaired else None,
+                'astar_nodes': full['nodes_explored'] if full else None,
+                'lpa_ms': round(lpa_ms, 4),
+                'astar_ms': round(astar_ms, 4)
+            })
+
+    # The unreachable batches stop both searches early, so leave them out
+    reached = [row for row in rows if row['reachable']]
+    print(f"\n  {len(reached)} of {len(rows)} batches of {edits} edits left the end reachable")
+    if reached:
+        print(f"  LPA* re-expanded (median) {np.median([r['reexpanded'] for r in reached]):>10.0f}"
+              f"   in {np.median([r['lpa_ms'] for r in reached]):>10.3f} ms")
+        print(f"  A* from scratch (median)  {np.median([r['astar_nodes'] for r in reached]):>10.0f}"
+              f"   in {np.median([r['astar_ms'] for r in reached]):>10.3f} ms")
+    return rows
+
+
+def save_results(rows, config, prefix):
+    with open(f"{prefix}.csv", 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(f"{prefix}.json", 'w') as f:
+        json.dump({'config': config, 'results': rows}, f, indent=2)
+    print(f"Benchmark data saved to {prefix}.csv and {prefix}.json")
+
+
+def plot_scaling(rows, path):
+    """Log-log median time and nodes/sec against maze size, one column per
+    loop_factor"""
+    loop_factors = sorted({row['loop_factor'] for row in rows})
+    names = list(dict.fromkeys(row['algorithm'] for row in rows))
+    fig, axes = plt.subplots(2, len(loop_factors), squeeze=False,
+                             figsize=(6 * len(loop_factors), 10))
+
+    for col, loop_factor in enumerate(loop_factors):
+        for name in names:
+            series = sorted((row['size'], row['median_ms'], row['nodes_per_sec'])
+                            for row in rows
+                            if row['algorithm'] == name and row['loop_factor'] == loop_factor)
+            sizes = [size for size, _, _ in series]
+            axes[0][col].plot(sizes, [ms for _, ms, _ in series], marker='o', label=name)
+            axes[1][col].plot(sizes, [rate or np.nan for _, _, rate in series],
+                              marker='o', label=name)
+        axes[0][col].set_title(f"Median time (loop_factor {loop_factor})")
+        axes[1][col].set_title(f"Nodes per second (loop_factor {loop_factor})")
+        axes[0][col].set_ylabel('ms')
+        axes[1][col].set_ylabel('nodes / s')
+        for ax in (axes[0][col], axes[1][col]):
+            ax.set_xscale('log')
+            ax.set_yscale('log')
+            ax.set_xlabel('cells per side')
+            ax.grid(True, which='both', alpha=0.3)
+    axes[0][0].legend(fontsize=8)
+
+    plt.suptitle('Solver Scaling', fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close(fig)
+    print(f"Scaling chart saved to {path}")
+
+
+def compare_to_baseline(rows, baseline_path, threshold):
+    """Print rows whose median time grew more than threshold (a fraction)
+    over the baseline; returns the regressions"""
+    with open(baseline_path) as f:
+        baseline = {(row['algorithm'], row['size'], row['loop_factor']): row
+                    for row in json.load(f)['results']}
+
+    regressions = []
+    print("\n" + "="*100)
+    print(f"  COMPARISON WITH BASELINE ({baseline_path})")
+    print("="*100)
+    print(f"\n{'Algorithm':<25} {'Size':<7} {'Loops':<7} {'Baseline ms':<13} {'Now ms':<13} {'Change':<10}")
+    print("-"*100)
+    for row in rows:
+        old = baseline.get((row['algorithm'], row['size'], row['loop_factor']))
+        if old is None or not old['median_ms']:
+            continue
+        change = row['median_ms'] / old['median_ms'] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  ⚠️  REGRESSION'
+            regressions.append((row, old))
+        print(f"{row['algorithm']:<25} {row['size']:<7} {row['loop_factor']:<7} "
+              f"{old['median_ms']:<13.3f} {row['median_ms']:<13.3f} {change:<+10.1%}{flag}")
+    print("="*100)
+    print(f"{len(regressions)} regression(s) over {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every solver across maze sizes, loop factors and seeds")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[15, 50, 150, 500],
+                        help="maze cells per side (e.g. 15 ... 2000)")
+    parser.add_argument('--loop-factors', type=float, nargs='+', default=[0.0, 0.2, 0.5])
+    parser.add_argument('--seeds', type=int, default=3, help="mazes per size and loop factor")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed runs per maze")
+    parser.add_argument('--repeats', type=int, default=3, help="timed runs per maze")
+    parser.add_argument('--solvers', nargs='+', help="solver class names (default: all)")
+    parser.add_argument('--output', default=os.path.join('charts', 'benchmark'),
+                        help="prefix for the .csv, .json and .png outputs")
+    parser.add_argument('--baseline', help="earlier benchmark .json to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="slowdown fraction flagged as a regression")
+    parser.add_argument('--max-cost', type=int, default=1,
+                        help="random terrain step costs 1..MAX_COST (1: unweighted)")
+    parser.add_argument('--indexed-heap', action='store_true',
+                        help="queue with the decrease-key IndexedHeap instead of heapq")
+    parser.add_argument('--replan', type=int, metavar='BATCHES',
+                        help="instead, time LPA* repairs over this many edit batches "
+                             "per maze (first size and loop factor) against A*")
+    parser.add_argument('--edits', type=int, default=5, help="cells toggled per replan batch")
+    args = parser.parse_args()
+
+    if args.replan:
+        print("\n⏱️  Running replanning benchmark...")
+        rows = run_replan(args.sizes[0], args.loop_factors[0], args.seeds,
+                          args.replan, args.edits)
+        with open(f"{args.output}_replan.json", 'w') as f:
+            json.dump({'config': vars(args), 'results': rows}, f, indent=2)
+        print(f"Replanning data saved to {args.output}_replan.json")
+        return
+
+    solvers = all_solvers()
+    if args.solvers:
+        solvers = [cls for cls in solvers if cls.__name__ in args.solvers]
+
+    print("\n⏱️  Running benchmark...")
+    rows = run_benchmark(args.sizes, args.loop_factors, args.seeds, solvers,
+                         args.warmup, args.repeats, max_cost=args.max_cost,
+                         indexed_heap=args.indexed_heap)
+    config = {key: value for key, value in vars(args).items()
+              if key not in ('output', 'baseline', 'threshold')}
+    config['solvers'] = [cls.__name__ for cls in solvers]
+    save_results(rows, config, args.output)
+    plot_scaling(rows, f"{args.output}_scaling.png")
+
+    if args.baseline:
+        regressions = compare_to_baseline(rows, args.baseline, args.threshold)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,71 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.colors import LinearSegmentedColormap
+import math
+import numpy as np
+import multiprocessing
 import os
-from algorithms import BFS, DFS, Dijkstra, AStar, GreedyBestFirst, BidirectionalBFS, UniformCostSearch, JumpPointSearch
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from algorithms import BFS, DFS, Dijkstra, AStar, GreedyBestFirst, BidirectionalBFS, UniformCostSearch, JumpPointSearch, WavefrontBFS, ContractedDijkstra, ContractedAStar, HPAStar, LPAStar, DialDijkstra, BidirectionalDijkstra, BidirectionalAStar, Grid, Instrumentation
+from maze.shared_maze import SharedMaze
 
+ALGORITHMS = [
+    ('BFS', BFS),
+    ('DFS', DFS),
+    ('Dijkstra', Dijkstra),
+    ('A*', AStar),
+    ('Greedy Best-First', GreedyBestFirst),
+    ('Bidirectional BFS', BidirectionalBFS),
+    ('Uniform Cost Search', UniformCostSearch),
+    ('Jump Point Search', JumpPointSearch),
+    ('Wavefront BFS', WavefrontBFS),
+    ('Contracted Dijkstra', ContractedDijkstra),
+    ('Contracted A*', ContractedAStar),
+    ('HPA*', HPAStar),
+    ('LPA*', LPAStar),
+    ('Dial Dijkstra', DialDijkstra),
+    ('Bidirectional Dijkstra', BidirectionalDijkstra),
+    ('Bidirectional A*', BidirectionalAStar)
+]
 
-def compare_all_algorithms(maze, start, end, save_charts=False):
-    """Run and compare all algorithms"""
+_worker = {}  # Per-process state of a parallel comparison worker
+
+
+def compare_all_algorithms(maze, start, end, save_charts=False, workers=1,
+                           memory=True, counters=True, costs=None):
+    """Run and compare all algorithms; with workers > 1 each solver runs
+    in a worker process over a shared-memory copy of the maze. With memory,
+    peak memory is measured too, with and without step recording; with
+    counters, an instrumented run adds the search event counters. costs
+    (a per-cell terrain grid) makes the weighted solvers minimise it"""
     print("\n🔄 Running all algorithms...")
 
-    algorithms = [
-        ('BFS', BFS(maze, start, end).solve_with_steps),
-        ('DFS', DFS(maze, start, end).solve_with_steps),
-        ('Dijkstra', Dijkstra(maze, start, end).solve_with_steps),
-        ('A*', AStar(maze, start, end).solve_with_steps),
-        ('Greedy Best-First', GreedyBestFirst(maze, start, end).solve_with_steps),
-        ('Bidirectional BFS', BidirectionalBFS(maze, start, end).solve_with_steps),
-        ('Uniform Cost Search', UniformCostSearch(
-            maze, start, end).solve_with_steps),
-        ('Jump Point Search', JumpPointSearch(maze, start, end).solve_with_steps)
-    ]
-
-    results = []
-    for name, func in algorithms:
-        print(f"  Running {name}...")
-        result = func()
-        if result:
-            results.append(result)
+    if workers > 1:
+        if isinstance(maze, Grid):
+            if costs is None and maze.costs is not None:
+                costs = np.asarray(maze.costs).reshape(maze.rows, maze.cols)
+            maze = maze.maze
+        results = _run_parallel(maze, start, end, workers, memory, counters, costs)
+    else:
+        # One neighbor table for every solver; solve() skips step
+        # recording, so the timings measure only the search
+        grid = Grid.of(maze, costs)
+        maze = grid.maze
+        results = []
+        for name, solver_cls in ALGORITHMS:
+            print(f"  Running {name}...")
+            result = _measure(solver_cls, grid, start, end, memory, counters)
+            if result:
+                results.append(result)
 
     # Create comparison visualization
-    fig, axes = plt.subplots(2, 4, figsize=(24, 12))
+    grid_rows = math.ceil(len(results) / 4)
+    fig, axes = plt.subplots(grid_rows, 4, figsize=(24, 6 * grid_rows),
+                             squeeze=False)
     axes = axes.flatten()
+    for ax in axes[len(results):]:
+        ax.axis('off')
 
     grass_color = '#2d5016'
     path_color = '#ffffff'
@@ -39,7 +74,12 @@ def compare_all_algorithms(maze, start, end, save_charts=False):
 
     colors_map = {'BFS': '#2196F3', 'DFS': '#4CAF50', 'Dijkstra': '#FF9800', 'A*': '#E91E63',
                   'Greedy Best-First': '#9C27B0', 'Bidirectional BFS': '#00BCD4',
-                  'Uniform Cost Search': '#795548', 'Jump Point Search': '#607D8B'}
+                  'Uniform Cost Search': '#795548', 'Jump Point Search': '#607D8B',
+                  'Wavefront BFS': '#3F51B5',
+                  'Contracted Dijkstra': '#FFC107', 'Contracted A*': '#F44336',
+                  'HPA*': '#8BC34A', 'LPA*': '#CDDC39',
+                  'Dial Dijkstra': '#FF5722', 'Bidirectional Dijkstra': '#673AB7',
+                  'Bidirectional A*': '#880E4F'}
 
     for idx, result in enumerate(results):
         ax = axes[idx]
@@ -65,10 +105,10 @@ def compare_all_algorithms(maze, start, end, save_charts=False):
         ax.set_xticks([])
         ax.set_yticks([])
         ax.set_title(f"{result['algorithm']}\nNodes: {result['nodes_explored']} | "
-                     f"Path: {result['path_length']} | Time: {result['time']*1000:.2f}ms",
+                     f"Path: {result['path_length']} | Time: {result['time_ns']/1e6:.2f}ms",
                      fontsize=10, fontweight='bold')
 
-    plt.suptitle('Algorithm Comparison (8 Algorithms)',
+    plt.suptitle(f'Algorithm Comparison ({len(results)} Algorithms)',
                  fontsize=16, fontweight='bold')
     plt.tight_layout()
 
@@ -77,19 +117,41 @@ def compare_all_algorithms(maze, start, end, save_charts=False):
         plt.savefig(chart_path)
         print(f"Comparison chart saved to {chart_path}")
 
+    metrics_fig = _plot_metrics(results, colors_map)
+    if save_charts:
+        metrics_path = os.path.join('charts', 'algorithm_metrics.png')
+        metrics_fig.savefig(metrics_path)
+        print(f"Metrics chart saved to {metrics_path}")
+
     plt.show()
 
     # Print comparison
     print("\n" + "="*100)
     print("  ALGORITHM COMPARISON RESULTS")
     print("="*100)
-    print(f"\n{'Algorithm':<25} {'Nodes':<10} {'Path Length':<15} {'Time (ms)':<12}")
+    print(f"\n{'Algorithm':<25} {'Nodes':<10} {'Path Length':<13} {'Time (ms)':<12} "
+          f"{'Frontier':<10} {'Memory (KiB)':<14} {'With Steps (KiB)':<16}")
     print("-"*100)
     for r in results:
         print(
-            f"{r['algorithm']:<25} {r['nodes_explored']:<10} {r['path_length']:<15} {r['time']*1000:<12.3f}")
+            f"{r['algorithm']:<25} {r['nodes_explored']:<10} {r['path_length']:<13} {r['time_ns']/1e6:<12.3f} "
+            f"{r['peak_frontier']:<10} {_kib(r['peak_memory']):<14} {_kib(r.get('peak_memory_steps')):<16}")
     print("="*100)
 
+    if counters:
+        print("\n  SEARCH COUNTERS")
+        print("-"*100)
+        for r in results:
+            counts = ', '.join(f"{event}={count}" for event, count in sorted(r['counters'].items()))
+            print(f"{r['algorithm']:<25} {counts}")
+        print("="*100)
+
+    # Same search, two priority queues
+    timings = {r['algorithm']: r['time_ns'] for r in results}
+    if timings.get('Dijkstra') and timings.get('Dial Dijkstra'):
+        print(f"\n  Bucket queue (Dial) vs binary heap Dijkstra: "
+              f"{timings['Dijkstra'] / timings['Dial Dijkstra']:.2f}x faster")
+
     # Save comparison data if requested
     if save_charts:
         import json
@@ -102,7 +164,13 @@ def compare_all_algorithms(maze, start, end, save_charts=False):
                 'algorithm': result['algorithm'],
                 'nodes_explored': result['nodes_explored'],
                 'path_length': result['path_length'],
+                'path_cost': result.get('path_cost'),
                 'time': result['time'],
+                'time_ns': result['time_ns'],
+                'peak_frontier': result['peak_frontier'],
+                'peak_memory': result['peak_memory'],
+                'peak_memory_steps': result.get('peak_memory_steps'),
+                'counters': result.get('counters'),
                 'path': result['path']  # This is a list, so it's serializable
             }
             summary_results.append(summary)
@@ -110,3 +178,106 @@ def compare_all_algorithms(maze, start, end, save_charts=False):
         with open(data_path, 'w') as f:
             json.dump(summary_results, f, indent=2)
         print(f"Comparison data saved to {data_path}")
+
+
+def _measure(solver_cls, grid, start, end, memory, counters):
+    """Timed solve(); with memory, add the peak memory of solve() and of
+    solve_with_steps(), and with counters the event counters, each from a
+    separate run so the measuring stays out of the timing"""
+    result = solver_cls(grid, start, end).solve()
+    if result and counters:
+        probe = Instrumentation()
+        result['counters'] = solver_cls(grid, start, end).instrument(probe).solve()['counters']
+    if result and memory:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            result['peak_memory'] = solver_cls(grid, start, end).solve()['peak_memory']
+            traced = solver_cls(grid, start, end).solve_with_steps()
+            result['peak_memory_steps'] = traced['peak_memory']
+        finally:
+            if started:
+                tracemalloc.stop()
+    return result
+
+
+def _kib(size):
+    return '-' if size is None else f"{size / 1024:.1f}"
+
+
+def _plot_metrics(results, colors_map):
+    """Bar charts of nodes explored, peak frontier and peak memory"""
+    names = [result['algorithm'] for result in results]
+    colors = [colors_map[name] for name in names]
+    fig, axes = plt.subplots(1, 3, figsize=(24, 7))
+
+    axes[0].bar(names, [result['nodes_explored'] for result in results], color=colors)
+    axes[0].set_title('Nodes Explored', fontweight='bold')
+    axes[1].bar(names, [result['peak_frontier'] for result in results], color=colors)
+    axes[1].set_title('Peak Frontier Size', fontweight='bold')
+
+    # Memory of the plain search next to the same search recording steps
+    positions = range(len(results))
+    solve_kib = [(result['peak_memory'] or 0) / 1024 for result in results]
+    steps_kib = [(result.get('peak_memory_steps') or 0) / 1024 for result in results]
+    axes[2].bar([p - 0.2 for p in positions], solve_kib, width=0.4,
+                color=colors, label='solve()')
+    axes[2].bar([p + 0.2 for p in positions], steps_kib, width=0.4,
+                color=colors, alpha=0.45, hatch='//', label='solve_with_steps()')
+    axes[2].set_xticks(list(positions))
+    axes[2].set_xticklabels(names)
+    axes[2].set_title('Peak Memory (KiB)', fontweight='bold')
+    axes[2].legend()
+
+    for ax in axes:
+        ax.tick_params(axis='x', labelrotation=45)
+        ax.grid(True, axis='y', alpha=0.3)
+    fig.suptitle('Search Cost by Algorithm', fontsize=16, fontweight='bold')
+    fig.tight_layout()
+    return fig
+
+
+def _run_parallel(maze, start, end, workers, memory, counters, costs=None):
+    """Run every solver in a process pool, results in ALGORITHMS order"""
+    # Each worker gets a CPU of its own, so timings are not skewed by the
+    # other workers competing for it
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    workers = max(1, min(workers, len(ALGORITHMS), len(cpus)))
+    print(f"  Using {workers} worker processes")
+
+    with SharedMaze.create(maze) as shared:
+        next_slot = multiprocessing.Value('i', 0)
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(shared.name, shared.shape, start,
+                                           end, next_slot, cpus, costs)) as pool:
+            futures = {pool.submit(_run_solver, index, memory, counters): index
+                       for index in range(len(ALGORITHMS))}
+            finished = {}
+            for future in as_completed(futures):
+                index = futures[future]
+                finished[index] = future.result()
+                print(f"  Finished {ALGORITHMS[index][0]}")
+
+    return [finished[index] for index in sorted(finished) if finished[index]]
+
+
+def _init_worker(name, shape, start, end, next_slot, cpus, costs=None):
+    """Pin the worker to its own CPU and build its Grid from shared memory"""
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+    shared = SharedMaze.attach(name, shape)
+    _worker.update(shared=shared, grid=Grid(shared.maze, costs), start=start, end=end)
+
+
+def _run_solver(index, memory, counters):
+    solver_cls = ALGORITHMS[index][1]
+    return _measure(solver_cls, _worker['grid'], _worker['start'], _worker['end'],
+                    memory, counters)
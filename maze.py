@@ -1,20 +1,43 @@
 from maze.maze_generator import MazeGenerator
-from algorithms import BFS, DFS, Dijkstra, AStar, GreedyBestFirst, BidirectionalBFS, UniformCostSearch, JumpPointSearch
+from maze.storage import MazeCache
+from algorithms import BFS, DFS, Dijkstra, AStar, GreedyBestFirst, BidirectionalBFS, UniformCostSearch, JumpPointSearch, WavefrontBFS, BitsetBFS, ContractedDijkstra, ContractedAStar, HPAStar, LPAStar, DialDijkstra, BidirectionalDijkstra, BidirectionalAStar, Grid
 from visualizer import AnimatedMazeVisualizer
 from comparison import compare_all_algorithms
 from menu import show_menu
 
 
+SOLVERS = {
+    '1': BFS,
+    '2': DFS,
+    '3': Dijkstra,
+    '4': AStar,
+    '5': GreedyBestFirst,
+    '6': BidirectionalBFS,
+    '7': UniformCostSearch,
+    '8': JumpPointSearch,
+    '11': WavefrontBFS,
+    '12': BitsetBFS,
+    '13': ContractedDijkstra,
+    '14': ContractedAStar,
+    '15': HPAStar,
+    '16': LPAStar,
+    '17': DialDijkstra,
+    '18': BidirectionalDijkstra,
+    '19': BidirectionalAStar
+}
+
+
 # Main program
 if __name__ == "__main__":
     maze_gen = None
+    cache = MazeCache()  # Mazes are keyed by size, loop_factor and seed
+    seed = 0
 
     while True:
         if maze_gen is None:
-            print("\n🎲 Generating new maze...")
-            maze_gen = MazeGenerator(width=15, height=15, loop_factor=0.2)
-            maze_gen.generate()
-            maze_gen.add_entrance_exit()
+            print(f"\n🎲 Generating new maze (seed {seed})...")
+            maze_gen = cache.get(MazeGenerator, 15, 15, 0.2, seed)
+            grid = Grid(maze_gen.maze)  # Neighbor table shared by all solvers
             print("✅ Maze generated with multiple paths!")
 
         choice = show_menu()
@@ -25,53 +48,24 @@ if __name__ == "__main__":
 
         elif choice == '10':
             maze_gen = None
+            seed += 1
             continue
 
         elif choice == '9':
             compare_all_algorithms(
-                maze_gen.maze, maze_gen.start, maze_gen.end, save_charts=True)
+                grid, maze_gen.start, maze_gen.end, save_charts=True)
 
-        elif choice in ['1', '2', '3', '4', '5', '6', '7', '8']:
+        elif choice in SOLVERS:
             visualizer = AnimatedMazeVisualizer(
                 maze_gen.maze, maze_gen.start, maze_gen.end)
 
             print("\n🚀 Starting algorithm visualization...\n")
 
-            if choice == '1':
-                solver = BFS(maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '2':
-                solver = DFS(maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '3':
-                solver = Dijkstra(maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '4':
-                solver = AStar(maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '5':
-                solver = GreedyBestFirst(
-                    maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '6':
-                solver = BidirectionalBFS(
-                    maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '7':
-                solver = UniformCostSearch(
-                    maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-            elif choice == '8':
-                solver = JumpPointSearch(
-                    maze_gen.maze, maze_gen.start, maze_gen.end)
-                result = solver.solve_with_steps()
-
-            if result:
-                visualizer.animate_solution(result)
-            else:
-                print("❌ No solution found!")
+            # Frames are streamed from the solver while it searches
+            solver = SOLVERS[choice](grid, maze_gen.start, maze_gen.end)
+            visualizer.animate_stream(solver)
 
         else:
-            print("\n⚠️  Invalid choice! Please enter 0-10.")
+            print("\n⚠️  Invalid choice! Please enter 0-19.")
 
         input("\nPress Enter to continue...")
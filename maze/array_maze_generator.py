@@ -0,0 +1,106 @@
+import random
+from itertools import permutations
+import numpy as np
+from .maze_generator import MazeGenerator
+
+# Cell-to-cell steps as (dy, dx), in the order MazeGenerator tries them
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+# Every order in which a cell can try its four directions
+ORDERS = tuple(permutations(range(4)))
+
+
+class ArrayMazeGenerator(MazeGenerator):
+    """MazeGenerator for mazes with millions of cells.
+
+    Same recursive backtracker and loop pass, with the same 0/1 output,
+    but the maze is a NumPy uint8 array instead of a list of lists. The
+    backtracker only touches a padded bytearray of visited flags and the
+    direction each cell was entered from; corridors are carved into the
+    array afterwards in a few vectorized passes. Candidate walls for
+    loops come from neighbor masks, and the walls to remove are drawn row
+    by row, so no list of every wall position is ever built. Random
+    numbers come from a NumPy generator seeded with ``seed``.
+    """
+
+    def __init__(self, width=20, height=20, loop_factor=0.15, seed=None):
+        self.width = width
+        self.height = height
+        self.loop_factor = loop_factor
+        self.seed = random.randrange(2 ** 63) if seed is None else seed
+        self.maze = np.ones((height * 2 + 1, width * 2 + 1), dtype=np.uint8)
+
+    def generate(self):
+        rng = np.random.default_rng(self.seed)
+        entered_from = self._backtrack(rng)
+        self._carve(entered_from)
+        self._add_loops(rng)
+        return self.maze
+
+    def _backtrack(self, rng):
+        """Randomized DFS over cells; returns 1 + direction each cell was
+        entered by (0 for the first cell), as a (height, width) array"""
+        width, height = self.width, self.height
+        stride = width + 2  # One-cell border of visited cells on each side
+        visited = bytearray(stride * (height + 2))
+        entered = bytearray(len(visited))
+        border = np.ones((height + 2, stride), dtype=np.uint8)
+        border[1:-1, 1:-1] = 0
+        visited[:] = border.tobytes()
+
+        deltas = [dy * stride + dx for dy, dx in DIRECTIONS]
+        # Each cell tries directions in its own random order, which picks
+        # uniformly among its unvisited neighbors each time, as
+        # random.choice does
+        orders = tuple(tuple((code + 1, deltas[code]) for code in order)
+                       for order in ORDERS)
+        order_of = rng.integers(len(ORDERS), size=len(visited),
+                                dtype=np.uint8).tobytes()
+
+        first = stride + 1
+        visited[first] = 1
+        stack = [(first, iter(orders[order_of[first]]))]
+        while stack:
+            current, untried = stack[-1]
+            for code, delta in untried:
+                neighbor = current + delta
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    entered[neighbor] = code
+                    stack.append((neighbor, iter(orders[order_of[neighbor]])))
+                    break
+            else:
+                stack.pop()
+
+        return np.frombuffer(entered, dtype=np.uint8).reshape(
+            height + 2, stride)[1:-1, 1:-1]
+
+    def _carve(self, entered_from):
+        """Open every cell and the wall each one was entered through"""
+        self.maze[1::2, 1::2] = 0
+        for code, (dy, dx) in enumerate(DIRECTIONS, 1):
+            ys, xs = np.nonzero(entered_from == code)
+            self.maze[ys * 2 + 1 - dy, xs * 2 + 1 - dx] = 0
+
+    def _add_loops(self, rng):
+        removable = self._removable_walls()
+        per_row = removable.sum(axis=1)
+        total = int(per_row.sum())
+        num_walls_to_remove = min(int(total * self.loop_factor), total)
+        if num_walls_to_remove == 0:
+            return
+
+        # How many of the removed walls fall in each row, then which ones
+        picks = rng.multivariate_hypergeometric(per_row, num_walls_to_remove)
+        for i in np.flatnonzero(picks):
+            columns = np.flatnonzero(removable[i])
+            self.maze[i, rng.choice(columns, picks[i], replace=False)] = 0
+
+    def _removable_walls(self):
+        """Boolean mask of interior walls between two open cells"""
+        maze = self.maze
+        is_open = maze == 0
+        vertical = is_open[:-2, 1:-1] & is_open[2:, 1:-1]
+        horizontal = is_open[1:-1, :-2] & is_open[1:-1, 2:]
+        removable = np.zeros(maze.shape, dtype=bool)
+        removable[1:-1, 1:-1] = ~is_open[1:-1, 1:-1] & (vertical | horizontal)
+        return removable
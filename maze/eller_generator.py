@@ -0,0 +1,151 @@
+import random
+from .storage import pack_header, pack_row
+
+WALL, OPEN = 1, 0
+
+
+class EllerMazeGenerator:
+    """Eller's algorithm: builds the maze one row at a time.
+
+    Only the current row's cell sets are kept, so memory grows with the
+    width alone and ``height=None`` gives an endless maze. Rows come out
+    of ``rows()`` as bytearrays with the same 0/1 layout as
+    MazeGenerator (entrance and exit included, placed as
+    add_entrance_exit does), and can be written straight to a file or
+    pipe with ``write()``. Walls left standing by the perfect maze are
+    opened with probability ``loop_factor``, as MazeGenerator does with
+    its removable walls.
+    """
+
+    def __init__(self, width=20, height=20, loop_factor=0.15, seed=None):
+        self.width = width
+        self.height = height
+        self.loop_factor = loop_factor
+        self.seed = random.randrange(2 ** 63) if seed is None else seed
+        self.cols = width * 2 + 1
+        self.start = (0, 1)
+        self.end = (height * 2, self.cols - 2) if height is not None else None
+
+    def rows(self):
+        """Yield every maze row, top border first; the same seed always
+        gives the same rows"""
+        self.random = random.Random(self.seed)
+        width, cols = self.width, self.cols
+        top = bytearray([WALL]) * cols
+        top[1] = OPEN  # Entrance
+        yield top
+
+        sets = list(range(width))
+        next_set = width
+        y = 0
+        while self.height is None or y < self.height:
+            last = self.height is not None and y == self.height - 1
+            line, sets = self._join_across(sets, last)
+            if last:
+                below = bytearray([WALL]) * cols
+                below[-2] = OPEN  # Exit
+            else:
+                below, sets, next_set = self._join_down(sets, next_set)
+            yield line
+            yield below
+            y += 1
+
+    def _join_across(self, sets, last):
+        """Carve the row's cells and the walls between them; returns the
+        row and each cell's set after merging"""
+        line = bytearray([WALL]) * self.cols
+        line[1::2] = bytes(self.width)
+        parent = {}
+
+        def find(label):
+            while label in parent:
+                # Path halving keeps the chains short across a long row
+                up = parent[label]
+                if up in parent:
+                    parent[label] = parent[up]
+                label = up
+            return label
+
+        for x in range(self.width - 1):
+            left, right = find(sets[x]), find(sets[x + 1])
+            # The last row must join every remaining set
+            if left != right and (last or self.random.random() < 0.5):
+                parent[left] = right
+                line[x * 2 + 2] = OPEN
+            elif self.random.random() < self.loop_factor:
+                if left != right:
+                    parent[left] = right
+                line[x * 2 + 2] = OPEN
+
+        return line, [find(label) for label in sets]
+
+    def _join_down(self, sets, next_set):
+        """Carve passages to the next row, at least one per set; returns
+        the wall row below and the next row's sets"""
+        below = bytearray([WALL]) * self.cols
+        members = {}
+        for x, label in enumerate(sets):
+            members.setdefault(label, []).append(x)
+
+        next_sets = [None] * self.width
+        for label, cells in members.items():
+            down = [x for x in cells if self.random.random() < 0.5]
+            if not down:
+                down = [self.random.choice(cells)]
+            for x in down:
+                below[x * 2 + 1] = OPEN
+                next_sets[x] = label
+
+        for x in range(self.width):
+            if next_sets[x] is None:
+                if self.random.random() < self.loop_factor:
+                    below[x * 2 + 1] = OPEN  # Loop: joins the set above
+                    next_sets[x] = sets[x]
+                else:
+                    next_sets[x] = next_set
+                    next_set += 1
+        return below, next_sets, next_set
+
+    def write(self, file):
+        """Write the rows, one byte per cell, to a path or binary file
+        object (e.g. a pipe); returns the number of rows written"""
+        if isinstance(file, str):
+            with open(file, 'wb') as f:
+                return self.write(f)
+        count = 0
+        for row in self.rows():
+            file.write(row)
+            count += 1
+        return count
+
+    def save(self, path):
+        """Stream the maze into a file in the bit-packed maze format
+        (needs a finite height)"""
+        if self.height is None:
+            raise ValueError("an endless maze cannot be saved")
+        with open(path, 'wb') as f:
+            f.write(pack_header(self.height * 2 + 1, self.cols, self.start,
+                                self.end, self.seed, self.loop_factor))
+            for row in self.rows():
+                f.write(pack_row(row))
+
+
+def read_rows(file, cols):
+    """Yield the rows of a maze written by EllerMazeGenerator.write
+
+    >>> import io
+    >>> from algorithms.grid import Grid
+    >>> generator = EllerMazeGenerator(4, 3, seed=1)
+    >>> file = io.BytesIO()
+    >>> generator.write(file)
+    7
+    >>> _ = file.seek(0)
+    >>> grid = Grid.from_rows(read_rows(file, generator.cols))
+    >>> grid.maze.tolist() == [list(row) for row in generator.rows()]
+    True
+    """
+    while True:
+        row = file.read(cols)
+        if len(row) < cols:
+            return
+        yield row
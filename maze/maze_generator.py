@@ -1,11 +1,15 @@
 import random
+from .storage import load_maze, open_maze, save_maze
 
 
 class MazeGenerator:
-    def __init__(self, width=20, height=20, loop_factor=0.15):
+    def __init__(self, width=20, height=20, loop_factor=0.15, seed=None):
         self.width = width
         self.height = height
         self.loop_factor = loop_factor
+        # Without a seed, draw one so the maze can still be reproduced
+        self.seed = random.randrange(2 ** 63) if seed is None else seed
+        self.random = random.Random(self.seed)
         self.maze = [[1 for _ in range(width * 2 + 1)]
                      for _ in range(height * 2 + 1)]
 
@@ -20,7 +24,7 @@ class MazeGenerator:
             neighbors = self._get_unvisited_neighbors(x, y)
 
             if neighbors:
-                next_x, next_y = random.choice(neighbors)
+                next_x, next_y = self.random.choice(neighbors)
                 wall_x = x * 2 + 1 + (next_x - x)
                 wall_y = y * 2 + 1 + (next_y - y)
                 self.maze[wall_y][wall_x] = 0
@@ -40,7 +44,7 @@ class MazeGenerator:
                     wall_positions.append((i, j))
 
         num_walls_to_remove = int(len(wall_positions) * self.loop_factor)
-        walls_to_remove = random.sample(wall_positions, min(
+        walls_to_remove = self.random.sample(wall_positions, min(
             num_walls_to_remove, len(wall_positions)))
 
         for i, j in walls_to_remove:
@@ -72,3 +76,23 @@ class MazeGenerator:
         self.start = (0, 1)
         self.maze[-1][-2] = 0
         self.end = (len(self.maze) - 1, len(self.maze[0]) - 2)
+
+    def save(self, path, bits=1):
+        """Save the maze, endpoints and seed in the maze file format
+        (bits=8 for a file that load(path, mmap=True) can map)"""
+        save_maze(path, self.maze, self.start, self.end,
+                  self.seed, self.loop_factor, bits)
+
+    @classmethod
+    def load(cls, path, mmap=False):
+        """Generator holding a maze read back from a file, ready to solve;
+        with mmap=True the maze is a zero-copy np.memmap of the file"""
+        data = open_maze(path) if mmap else load_maze(path)
+        rows, cols = data['maze'].shape
+        maze_gen = cls.__new__(cls)
+        maze_gen.width, maze_gen.height = (cols - 1) // 2, (rows - 1) // 2
+        maze_gen.loop_factor = data['loop_factor']
+        maze_gen.seed = data['seed']
+        maze_gen.maze = data['maze']
+        maze_gen.start, maze_gen.end = data['start'], data['end']
+        return maze_gen
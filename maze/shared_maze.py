@@ -0,0 +1,46 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+
+class SharedMaze:
+    """A 0/1 maze held in a multiprocessing.shared_memory block.
+
+    The creating process copies the maze in once; worker processes attach
+    by name and get a NumPy view of the same bytes, so the maze is never
+    pickled. Use as a context manager in the creating process to free the
+    block afterwards.
+    """
+
+    def __init__(self, shm, shape, owner):
+        self.shm = shm
+        self.shape = shape
+        self.owner = owner
+        self.maze = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, maze):
+        cells = np.asarray(maze, dtype=np.uint8)
+        shm = shared_memory.SharedMemory(create=True, size=max(cells.size, 1))
+        shared = cls(shm, cells.shape, owner=True)
+        shared.maze[...] = cells
+        return shared
+
+    @classmethod
+    def attach(cls, name, shape):
+        return cls(shared_memory.SharedMemory(name=name), shape, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        self.maze = None  # The view must go before the block is closed
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
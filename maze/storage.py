@@ -0,0 +1,125 @@
+import hashlib
+import os
+import struct
+import numpy as np
+
+# File layout: header, then the maze rows. With 1 bit per cell each row
+# is padded to a whole byte (most significant bit first); with 8 bits per
+# cell the rows are the raw 0/1 bytes, which open_maze() can map straight
+# into memory
+MAGIC = b'MAZE'
+VERSION = 1
+NO_SEED = -1
+# magic, version, bits per cell, rows, cols, seed, loop_factor,
+# start row/col, end row/col
+HEADER = struct.Struct('<4sBB2xIIqd4i')
+
+
+def pack_header(rows, cols, start, end, seed=None, loop_factor=None, bits=1):
+    return HEADER.pack(MAGIC, VERSION, bits, rows, cols,
+                       NO_SEED if seed is None else seed,
+                       float('nan') if loop_factor is None else loop_factor,
+                       start[0], start[1], end[0], end[1])
+
+
+def pack_row(row):
+    """One maze row as bytes, 1 bit per cell"""
+    return np.packbits(np.asarray(row, dtype=np.uint8)).tobytes()
+
+
+def save_maze(path, maze, start, end, seed=None, loop_factor=None, bits=1):
+    """Write a 0/1 maze and its endpoints; bits=8 stores one byte per
+    cell so the file can be memory-mapped by open_maze()"""
+    if bits not in (1, 8):
+        raise ValueError("bits must be 1 or 8")
+    cells = np.asarray(maze, dtype=np.uint8)
+    rows, cols = cells.shape
+    with open(path, 'wb') as f:
+        f.write(pack_header(rows, cols, start, end, seed, loop_factor, bits))
+        if bits == 1:
+            f.write(np.packbits(cells, axis=1).tobytes())
+        else:
+            cells.tofile(f)
+
+
+def read_header(f, path):
+    header = f.read(HEADER.size)
+    if len(header) < HEADER.size or header[:4] != MAGIC:
+        raise ValueError(f"{path} is not a maze file")
+    (_, version, bits, rows, cols, seed, loop_factor,
+     start_row, start_col, end_row, end_col) = HEADER.unpack(header)
+    if version != VERSION or bits not in (1, 8):
+        raise ValueError(f"{path}: unsupported maze file version {version}")
+    return {
+        'bits': bits,
+        'shape': (rows, cols),
+        'start': (start_row, start_col),
+        'end': (end_row, end_col),
+        'seed': None if seed == NO_SEED else seed,
+        'loop_factor': None if loop_factor != loop_factor else loop_factor
+    }
+
+
+def load_maze(path):
+    """Read a maze file; returns a dict with the maze as a uint8 array"""
+    with open(path, 'rb') as f:
+        info = read_header(f, path)
+        rows, cols = info.pop('shape')
+        if info.pop('bits') == 8:
+            maze = np.fromfile(f, dtype=np.uint8, count=rows * cols)
+            maze = maze.reshape(rows, cols)
+        else:
+            packed = np.fromfile(f, dtype=np.uint8,
+                                 count=rows * ((cols + 7) // 8))
+            maze = np.unpackbits(packed.reshape(rows, -1), axis=1, count=cols)
+    return {'maze': maze, **info}
+
+
+def open_maze(path):
+    """Like load_maze, but the maze is a read-only np.memmap of the file.
+
+    Nothing is read up front: solvers and the visualizer page cells in as
+    they touch them, and the pages are shared with the OS file cache.
+    Only files saved with bits=8 can be mapped.
+    """
+    with open(path, 'rb') as f:
+        info = read_header(f, path)
+    if info.pop('bits') != 8:
+        raise ValueError(f"{path} is bit-packed; save it with bits=8 to map it")
+    maze = np.memmap(path, dtype=np.uint8, mode='r',
+                     offset=HEADER.size, shape=info.pop('shape'))
+    return {'maze': maze, **info}
+
+
+class MazeCache:
+    """On-disk cache of generated mazes.
+
+    A maze is fully determined by its generator and (width, height,
+    loop_factor, seed), so the file name is a hash of those; a repeated
+    request loads the file instead of generating the maze again.
+    """
+
+    def __init__(self, directory='maze_cache'):
+        self.directory = directory
+
+    def path(self, generator_cls, width, height, loop_factor, seed):
+        key = f"{generator_cls.__name__}:{width}:{height}:{loop_factor!r}:{seed}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:20]
+        return os.path.join(self.directory, f"{digest}.maze")
+
+    def get(self, generator_cls, width, height, loop_factor, seed):
+        """Load the maze from the cache, generating and storing it on a miss;
+        returns a generator holding maze, start and end"""
+        path = self.path(generator_cls, width, height, loop_factor, seed)
+        if os.path.exists(path):
+            return generator_cls.load(path)
+
+        maze_gen = generator_cls(width, height, loop_factor, seed=seed)
+        maze_gen.generate()
+        maze_gen.add_entrance_exit()
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename, so a half-written file is never picked up
+        partial = f"{path}.{os.getpid()}.tmp"
+        maze_gen.save(partial)
+        os.replace(partial, path)
+        return maze_gen
@@ -0,0 +1,15 @@
+import numpy as np
+
+
+def random_terrain(shape, max_cost=9, seed=None, patch=4):
+    """Integer step costs 1..max_cost for a maze of the given shape.
+
+    Costs are drawn per patch x patch block, so the terrain comes in
+    regions (cheap grass, costly mud) rather than per-cell noise. Pass
+    the result as Grid(maze, costs=...).
+    """
+    rows, cols = shape
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(1, max_cost + 1, size=(-(-rows // patch), -(-cols // patch)),
+                          dtype=np.uint8)
+    return np.repeat(np.repeat(blocks, patch, axis=0), patch, axis=1)[:rows, :cols]
@@ -12,10 +12,19 @@ def show_menu():
     print("  6. Bidirectional BFS - Searches from both ends")
     print("  7. Uniform Cost Search - Cost-based exploration")
     print("  8. Jump Point Search - Optimized grid search")
+    print(" 11. Wavefront BFS - Whole-layer NumPy expansion")
+    print(" 12. Bitset BFS - Bit-parallel layers (slower than BFS on mazes)")
+    print(" 13. Contracted Dijkstra - Junction graph, corridors skipped")
+    print(" 14. Contracted A* - A* over the junction graph")
+    print(" 15. HPA* - Hierarchical search over maze clusters")
+    print(" 16. LPA* - A* that repairs itself when walls change")
+    print(" 17. Dial Dijkstra - Dijkstra with a bucket queue")
+    print(" 18. Bidirectional Dijkstra - Dijkstra from both ends")
+    print(" 19. Bidirectional A* - A* from both ends")
     print("  9. Compare All Algorithms")
     print(" 10. Generate New Maze")
     print("  0. Exit")
     print("\n" + "="*70)
 
-    choice = input("\n  Enter your choice (0-10): ").strip()
+    choice = input("\n  Enter your choice (0-19): ").strip()
     return choice
@@ -5,18 +5,67 @@ import numpy as np
 from matplotlib.animation import FuncAnimation
 
 
+class VisitedRaster:
+    """Visited cells as an RGBA image over the maze, painted incrementally.
+
+    Each frame paints only the cells visited since the previous one, so a
+    frame costs O(new cells) however many were visited before, and drawing
+    the layer costs the same for ten cells or a million. Mazes wider than
+    max_side cells are painted in blocks of cells, one pixel per block:
+    the axes has fewer pixels than that anyway, and resampling the full
+    image would dominate the frame.
+    """
+
+    def __init__(self, ax, shape, color=(0, 255, 255, 77), max_side=512):
+        rows, cols = shape
+        self.block = -(-max(rows, cols) // max_side)  # Cells per pixel side
+        height, width = -(-rows // self.block), -(-cols // self.block)
+        self.rgba = np.zeros((height, width, 4), dtype=np.uint8)  # Transparent
+        self.color = np.array(color, dtype=np.uint8)
+        # Stretch the pixels over their cells, keeping the maze's limits
+        limits = ax.get_xlim(), ax.get_ylim()
+        self.image = ax.imshow(self.rgba, interpolation='none', zorder=3,
+                               extent=(-0.5, width * self.block - 0.5,
+                                       height * self.block - 0.5, -0.5))
+        ax.set_xlim(limits[0])
+        ax.set_ylim(limits[1])
+        self.painted = {}  # Cells painted so far, per search direction
+
+    def paint(self, cells):
+        """Paint (row, col) cells in the visited color"""
+        if cells:
+            rows, cols = np.array(cells).T
+            if self.block > 1:
+                rows, cols = rows // self.block, cols // self.block
+            self.rgba[rows, cols] = self.color
+            self.image.set_data(self.rgba)
+
+    def paint_step(self, step):
+        """Bring the layer up to a StepTrace step, painting only the
+        cells visited since the last step painted in its direction"""
+        direction = step.get('direction', 'forward')
+        visited = step['visited']
+        done = self.painted.get(direction, 0)
+        if len(visited) < done:  # Stepped backwards: start over
+            self.clear()
+            done = 0
+        self.paint(visited.since(done))
+        self.painted[direction] = len(visited)
+
+    def clear(self):
+        self.rgba[:] = 0
+        self.painted.clear()
+        self.image.set_data(self.rgba)
+
+
 class AnimatedMazeVisualizer:
     def __init__(self, maze, start, end):
-        self.maze = np.array(maze)
+        self.maze = np.asarray(maze)  # No copy of an array or memmap
         self.start = start
         self.end = end
 
-    def animate_solution(self, result):
-        """Animate the algorithm solving the maze"""
-        if not result or 'steps' not in result:
-            print("No solution found!")
-            return
-
+    def _setup_figure(self, algorithm):
+        """Create the figure and the artists that the animations update"""
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
 
         # Setup maze visualization
@@ -28,7 +77,7 @@ class AnimatedMazeVisualizer:
         ax1.imshow(self.maze, cmap=cmap, interpolation='nearest')
         ax1.set_xticks([])
         ax1.set_yticks([])
-        ax1.set_title(f'{result["algorithm"]} - Solving...',
+        ax1.set_title(f'{algorithm} - Solving...',
                       fontsize=14, fontweight='bold')
 
         # Start and end markers
@@ -47,8 +96,7 @@ class AnimatedMazeVisualizer:
                  fontweight='bold', color='white', zorder=11)
 
         # Initialize plot elements
-        visited_scatter = ax1.scatter(
-            [], [], c='cyan', s=20, alpha=0.3, zorder=3)
+        visited = VisitedRaster(ax1, self.maze.shape)
         current_scatter = ax1.scatter(
             [], [], c='yellow', s=100, marker='*', zorder=5)
         path_line, = ax1.plot([], [], 'b-', linewidth=2, alpha=0.6, zorder=4)
@@ -58,13 +106,58 @@ class AnimatedMazeVisualizer:
         info_text = ax2.text(0.1, 0.9, '', fontsize=12, verticalalignment='top',
                              family='monospace', wrap=True)
 
+        return fig, visited, current_scatter, path_line, info_text
+
+    def _progress_info(self, algorithm, step_label, nodes, path_length,
+                       current, result=None):
+        """Info panel text; pass result once the search has finished"""
+        info = f"""
+{algorithm} ALGORITHM
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+PROGRESS
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Step: {step_label}
+Nodes Explored: {nodes}
+Current Path Length: {path_length}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+STATUS
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+        if result is not None:
+            info += f"""✅ SOLUTION FOUND!
+
+Final Path Length: {result['path_length']}
+Total Nodes Explored: {result['nodes_explored']}
+Time Taken: {result['time']*1000:.2f} ms
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+        else:
+            info += f"""🔍 Searching...
+
+Current Position: {current}
+"""
+        return info
+
+    def animate_solution(self, result):
+        """Animate the algorithm solving the maze"""
+        if not result or 'steps' not in result:
+            print("No solution found!")
+            return
+
+        fig, visited, current_scatter, path_line, info_text = \
+            self._setup_figure(result['algorithm'])
+
         steps = result['steps']
 
         def init():
-            visited_scatter.set_offsets(np.empty((0, 2)))
+            visited.clear()
             current_scatter.set_offsets(np.empty((0, 2)))
             path_line.set_data([], [])
-            return visited_scatter, current_scatter, path_line, info_text
+            return visited.image, current_scatter, path_line, info_text
 
         def update(frame):
             if frame >= len(steps):
@@ -72,11 +165,8 @@ class AnimatedMazeVisualizer:
 
             step = steps[frame]
 
-            # Update visited nodes
-            visited_list = list(step['visited'])
-            if visited_list:
-                visited_array = np.array([[p[1], p[0]] for p in visited_list])
-                visited_scatter.set_offsets(visited_array)
+            # Paint only the cells visited since the previous frame
+            visited.paint_step(step)
 
             # Update current node
             current = step['current']
@@ -90,51 +180,98 @@ class AnimatedMazeVisualizer:
                 path_line.set_data(path_x, path_y)
 
             # Update info text
-            info = f"""
-{result['algorithm']} ALGORITHM
+            finished = result if frame == len(steps) - 1 else None
+            info_text.set_text(self._progress_info(
+                result['algorithm'], f"{frame + 1} / {len(steps)}",
+                len(step['visited']), len(step['path']), current, finished))
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-PROGRESS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Step: {frame + 1} / {len(steps)}
-Nodes Explored: {len(step['visited'])}
-Current Path Length: {len(step['path'])}
+            return visited.image, current_scatter, path_line, info_text
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-STATUS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        # Calculate animation speed based on number of steps
+        interval = max(50, min(500, 10000 // len(steps)))
 
-            if frame == len(steps) - 1:
-                info += f"""✅ SOLUTION FOUND!
+        anim = FuncAnimation(fig, update, frames=len(steps), init_func=init,
+                             interval=interval, blit=True, repeat=False)
 
-Final Path Length: {result['path_length']}
-Total Nodes Explored: {result['nodes_explored']}
-Time Taken: {result['time']*1000:.2f} ms
+        plt.tight_layout()
+        plt.show()
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-            else:
-                info += f"""🔍 Searching...
+        # Show final explanation
+        self.show_explanation(result)
 
-Current Position: {current}
-"""
+    def animate_stream(self, solver):
+        """Animate a solver live, drawing each frame from solver.solve_iter()
 
-            info_text.set_text(info)
+        The first frame is drawn as soon as the search takes its first step,
+        and no step history is kept: only the drawing state (visited cells
+        and their parents, needed for the current path) grows.
+        """
+        fig, visited, current_scatter, path_line, info_text = \
+            self._setup_figure(solver.name)
 
-            return visited_scatter, current_scatter, path_line, info_text
+        parents = {}
+        state = {'visited': 0, 'step': 0, 'done': False, 'result': None}
 
-        # Calculate animation speed based on number of steps
-        interval = max(50, min(500, 10000 // len(steps)))
+        def frames():
+            state['result'] = yield from solver.solve_iter()
+            state['done'] = True
+            yield None  # One last frame to show the final result
 
-        anim = FuncAnimation(fig, update, frames=len(steps), init_func=init,
-                             interval=interval, blit=True, repeat=False)
+        def init():
+            visited.clear()
+            current_scatter.set_offsets(np.empty((0, 2)))
+            path_line.set_data([], [])
+            return visited.image, current_scatter, path_line, info_text
+
+        def update(event):
+            if event is None:
+                result = state['result']
+                if result is None:
+                    info_text.set_text("\n❌ No solution found!")
+                    return visited.image, current_scatter, path_line, info_text
+                path = result['path']
+                current = path[-1]
+            else:
+                state['step'] += 1
+                tree = parents.setdefault(event.get('direction', 'forward'), {})
+                new_cells = []
+                for cell, parent in event['new_visited']:
+                    tree[cell] = parent
+                    new_cells.append(cell)
+                visited.paint(new_cells)
+                state['visited'] += len(new_cells)
+
+                current = event['current']
+                path = []
+                cell = current
+                while cell is not None:
+                    path.append(cell)
+                    cell = tree.get(cell)
+
+            current_scatter.set_offsets([[current[1], current[0]]])
+            if len(path) > 1:
+                path_line.set_data([p[1] for p in path], [p[0] for p in path])
+
+            info_text.set_text(self._progress_info(
+                solver.name, state['step'], state['visited'], len(path),
+                current, state['result']))
+
+            return visited.image, current_scatter, path_line, info_text
+
+        # Frames are produced on demand and never cached, so memory does not
+        # depend on how long the search runs
+        anim = FuncAnimation(fig, update, frames=frames(), init_func=init,
+                             interval=50, blit=True, repeat=False,
+                             cache_frame_data=False)
 
         plt.tight_layout()
         plt.show()
 
-        # Show final explanation
-        self.show_explanation(result)
+        if state['done']:
+            if state['result'] is None:
+                print("No solution found!")
+            else:
+                self.show_explanation(state['result'])
 
     def show_explanation(self, result):
         """Show detailed explanation after animation"""
@@ -216,7 +353,7 @@ Current Position: {current}
                 'description': 'Searches from both start and end simultaneously.',
                 'how_it_works': [
                     '1. Starts BFS from both start and end',
-                    '2. Explores from both directions',
+                    '2. Expands a whole layer of the smaller frontier at a time',
                     '3. Stops when searches meet in middle',
                     '4. Combines paths from both sides'
                 ],
@@ -241,17 +378,143 @@ Current Position: {current}
             },
             'Jump Point Search': {
                 'name': 'Jump Point Search',
-                'description': 'Optimized grid pathfinding that skips redundant nodes.',
+                'description': 'A* that jumps along straight corridors instead of stepping cell by cell.',
                 'how_it_works': [
-                    '1. Identifies key points (jump points) in grid',
-                    '2. Only considers nodes that change direction',
-                    '3. Skips straight-line nodes',
-                    '4. Reduces nodes to explore significantly'
+                    '1. From each node, jumps in a straight line until something changes',
+                    '2. Stops only at the goal or a forced neighbor (a new side opening)',
+                    '3. Only those jump points go into the priority queue',
+                    '4. Fills in the straight segments when rebuilding the path'
                 ],
                 'guarantees': 'Finds SHORTEST path in grids',
-                'best_for': 'Large grid-based mazes',
-                'time_complexity': 'O(V) but with much smaller constant',
-                'space_complexity': 'O(V) - but explores fewer nodes'
+                'best_for': 'Large grid-based mazes with long corridors',
+                'time_complexity': 'O((V + E) log V) worst case, far fewer heap operations',
+                'space_complexity': 'O(V) - but only jump points enter the queue'
+            },
+            'Wavefront BFS': {
+                'name': 'Wavefront BFS (NumPy)',
+                'description': 'BFS that expands a whole distance layer at once with array operations.',
+                'how_it_works': [
+                    '1. Keeps the frontier as one array of cells',
+                    '2. Shifts it up/down/left/right into open cells in one step',
+                    '3. Labels the new layer with its distance from the start',
+                    '4. Walks downhill on the distance field to get the path'
+                ],
+                'guarantees': 'Always finds the SHORTEST path, plus distances to every cell',
+                'best_for': 'Distance fields and large, open or loopy mazes',
+                'time_complexity': 'O(V + E) array work, O(depth) interpreter steps',
+                'space_complexity': 'O(V) - one distance per cell'
+            },
+            'Bitset BFS': {
+                'name': 'Bitset BFS (Bit-parallel)',
+                'description': 'BFS that stores each maze row as bits and grows a whole layer with bitwise operations.',
+                'how_it_works': [
+                    '1. Packs every row into 64-bit words, one bit per cell',
+                    '2. Shifts the frontier bits left/right and to the rows above/below',
+                    '3. ANDs with the unvisited open cells to get the next layer',
+                    '4. Keeps distance mod 3 as bits and walks back from the goal'
+                ],
+                'guarantees': 'Always finds the SHORTEST path',
+                'best_for': 'Seeing bit-parallel BFS at work; slower than BFS on generated mazes',
+                'time_complexity': 'O(depth * frontier words) word operations',
+                'space_complexity': 'O(V) bits - no parent array'
+            },
+            'Contracted Dijkstra': {
+                'name': 'Contracted Dijkstra (Junction Graph)',
+                'description': 'Dijkstra over a graph of junctions and dead ends, with whole corridors as weighted edges.',
+                'how_it_works': [
+                    '1. Once per maze, turns every corridor into one edge weighted by its length',
+                    '2. Links start and end to the junctions at the ends of their corridors',
+                    '3. Runs Dijkstra expanding junctions only',
+                    '4. Walks the chosen corridors to rebuild the cell path'
+                ],
+                'guarantees': 'Always finds the SHORTEST path',
+                'best_for': 'Mazes made of long corridors (low loop factor)',
+                'time_complexity': 'O(J log J) for J junctions, after an O(V) build',
+                'space_complexity': 'O(V) for the cached junction graph'
+            },
+            'Contracted A*': {
+                'name': 'Contracted A* (Junction Graph)',
+                'description': 'A* over the junction graph, guided by Manhattan distance to the goal.',
+                'how_it_works': [
+                    '1. Uses the same cached junction graph as Contracted Dijkstra',
+                    '2. Orders junctions by corridor cost + Manhattan distance',
+                    '3. Stops once no junction can beat the best route to the goal',
+                    '4. Walks the chosen corridors to rebuild the cell path'
+                ],
+                'guarantees': 'Always finds the SHORTEST path',
+                'best_for': 'Large corridor mazes with a far-away goal',
+                'time_complexity': 'O(J log J) worst case, usually far fewer junctions',
+                'space_complexity': 'O(V) for the cached junction graph'
+            },
+            'HPA*': {
+                'name': 'HPA* (Hierarchical A*)',
+                'description': 'A* on an abstract graph of cluster entrances, refined cell by cell only where the route goes.',
+                'how_it_works': [
+                    '1. Once per maze, cuts the grid into square clusters',
+                    '2. Marks every opening between clusters as an entrance and stores distances inside each cluster',
+                    '3. Runs A* over the entrances only',
+                    '4. Searches just the clusters on the chosen route to rebuild the cell path'
+                ],
+                'guarantees': 'Finds the SHORTEST path (every opening is kept)',
+                'best_for': 'Very large mazes queried many times',
+                'time_complexity': 'O(E log E) over entrances per query, after a one-off build',
+                'space_complexity': 'O(entrances + intra-cluster edges)'
+            },
+            'LPA*': {
+                'name': 'LPA* (Lifelong Planning A*)',
+                'description': 'A* that keeps its search, so after walls change it only repairs the affected part.',
+                'how_it_works': [
+                    '1. Keeps two costs per cell: the settled one and a one-step lookahead',
+                    '2. Expands cells where the two disagree, in A* order',
+                    '3. When walls open or close, rechecks only the cells next to them',
+                    '4. Stops once the goal is settled and nothing cheaper is queued'
+                ],
+                'guarantees': 'Finds the SHORTEST path, after every change',
+                'best_for': 'Maps that change a little between searches',
+                'time_complexity': 'O(V log V) first search, then proportional to the change',
+                'space_complexity': 'O(V) kept between searches'
+            },
+            'Dial Dijkstra': {
+                'name': "Dial's Algorithm (Bucket-Queue Dijkstra)",
+                'description': 'Dijkstra for small integer step costs, with a ring of buckets in place of the heap.',
+                'how_it_works': [
+                    '1. Keeps one bucket per cost, max step cost + 1 of them in a ring',
+                    '2. Takes cells from the cheapest non-empty bucket',
+                    '3. Drops each improved neighbor into the bucket for its new cost',
+                    '4. Stops when the goal comes out of a bucket'
+                ],
+                'guarantees': 'Finds the LOWEST-COST path',
+                'best_for': 'Weighted terrain with small integer costs',
+                'time_complexity': 'O(V + E + C * D), C = max step cost, D = path cost',
+                'space_complexity': 'O(V + C)'
+            },
+            'Bidirectional Dijkstra': {
+                'name': 'Bidirectional Dijkstra',
+                'description': 'Dijkstra from the start and, in reverse, from the goal, meeting in the middle.',
+                'how_it_works': [
+                    '1. Runs Dijkstra forward from start and backward from goal',
+                    '2. Advances whichever side has the smaller frontier',
+                    '3. Remembers the cheapest route through any cell both sides reached',
+                    '4. Stops once the two cheapest open costs add up to at least that route'
+                ],
+                'guarantees': 'Finds the LOWEST-COST path (the first meeting is not enough)',
+                'best_for': 'Weighted mazes with the goal far from the start',
+                'time_complexity': 'O((V + E) log V), usually two smaller balls than one',
+                'space_complexity': 'O(V) for both searches'
+            },
+            'Bidirectional A*': {
+                'name': 'Bidirectional A* (Average Potentials)',
+                'description': 'Bidirectional Dijkstra where each side is pulled toward the other end.',
+                'how_it_works': [
+                    '1. Orders each side by cost plus half of (distance to its goal - distance to its root)',
+                    '2. Both sides then see the same consistent step costs',
+                    '3. Keeps the cheapest route through a cell reached from both ends',
+                    '4. Stops with the same rule as Bidirectional Dijkstra'
+                ],
+                'guarantees': 'Finds the LOWEST-COST path',
+                'best_for': 'Large weighted mazes with open areas',
+                'time_complexity': 'O((V + E) log V) worst case, usually far less',
+                'space_complexity': 'O(V) for both searches'
             }
         }
 